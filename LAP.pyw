@@ -4,12 +4,19 @@ Limbus Auto Player - Main Entry Point
 
 Entry point for the Limbus Company automation GUI application.
 """
+import time
+startup_start = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk
 from gui.main_window import LimbusAutoPlayerGUI
+from lib.library_checker import IMPORT_REPORT_ENABLED, IMPORT_TIMES
+from lib.monitor import set_dpi_awareness
 
 def main():
     """Main function to run the GUI"""
+    # Done by the pyautogui import before it was loaded lazily; has to happen before the window exists
+    set_dpi_awareness()
     root = tk.Tk()
     
     # Set up initial theme (will be overridden by theme manager)
@@ -36,6 +43,10 @@ def main():
         y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
         root.geometry(f"+{x}+{y}")
     
+    if IMPORT_REPORT_ENABLED:
+        root.update_idletasks()
+        IMPORT_TIMES['(startup to window)'] = time.perf_counter() - startup_start
+    
     # Start the GUI
     root.mainloop()
 
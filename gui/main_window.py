@@ -6,9 +6,6 @@ Main GUI window class that manages the overall application interface.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
-import time
-import queue
-import os
 
 try:
     from lib.settings_handler import load_settings_with_comments
@@ -17,7 +14,9 @@ except ImportError:
     from lib.config import load_settings
     USE_COMMENT_PRESERVING = False
 
+from lib.config import get_settings_file
 from lib.monitor import get_monitor_info
+from lib.run_config import RunConfig
 
 from .settings_manager import SettingsManager
 from .hotkey_manager import HotkeyManager
@@ -26,7 +25,12 @@ from .tabs.control_tab import ControlTab
 from .tabs.settings_tab import SettingsTab
 from .tabs.display_tab import DisplayTab
 from .tabs.status_tab import StatusTab
+from .tabs.performance_tab import PerformanceTab
 from .detection_worker import DetectionWorker
+from .status_feed import StatusFeed
+
+# How often queued status messages are flushed to the Control tab (milliseconds)
+STATUS_FLUSH_MS = 250
 
 class LimbusAutoPlayerGUI:
     def __init__(self, root):
@@ -48,6 +52,7 @@ class LimbusAutoPlayerGUI:
         self.screen_width = 1920
         self.screen_height = 1080
         self.settings_loaded_successfully = False
+        self.run_config = None
         
         # Control variables
         self.is_running = False
@@ -59,11 +64,13 @@ class LimbusAutoPlayerGUI:
         # GUI variables
         self.init_gui_variables()
         
-        # Status queue for thread communication
-        self.status_queue = queue.Queue()
+        # Bounded status feed for thread communication
+        self.status_feed = StatusFeed()
         
         # Initialize
         self.load_initial_settings()
+        self.update_run_config()
+        self.bind_run_config_traces()
         
         # Create UI
         try:
@@ -109,27 +116,26 @@ class LimbusAutoPlayerGUI:
                 self.settings = load_settings()
             
             # Use the repository root settings file
-            script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            self.gui_settings_file = os.path.join(script_dir, 'settings.ini')
+            self.gui_settings_file = get_settings_file()
             
             self.monitors = get_monitor_info()
             
-            # Set initial values
-            self.alt_tab_var.set(self.settings.get('alt_tab_after_click', False))
-            self.reset_cursor_var.set(self.settings.get('reset_cursor_position', True))
-            self.force_cursor_var.set(self.settings.get('force_cursor_to_monitor', False))
-            self.debug_logging_var.set(self.settings.get('debug_logging', False))
-            self.dark_mode_var.set(self.settings.get('dark_mode', False))
-            self.check_interval_var.set(self.settings.get('check_interval', 1.0))
-            self.tolerance_var.set(self.settings.get('tolerance', 10))
+            # Set initial values (the settings store fills in defaults)
+            self.alt_tab_var.set(self.settings['alt_tab_after_click'])
+            self.reset_cursor_var.set(self.settings['reset_cursor_position'])
+            self.force_cursor_var.set(self.settings['force_cursor_to_monitor'])
+            self.debug_logging_var.set(self.settings['debug_logging'])
+            self.dark_mode_var.set(self.settings['dark_mode'])
+            self.check_interval_var.set(self.settings['check_interval'])
+            self.tolerance_var.set(self.settings['tolerance'])
             
             # Set color values
-            target_color = self.settings.get('target_color', (59, 1, 0))
+            target_color = self.settings['target_color']
             self.target_r_var.set(target_color[0])
             self.target_g_var.set(target_color[1])
             self.target_b_var.set(target_color[2])
             
-            secondary_color = self.settings.get('secondary_color', (246, 175, 100))
+            secondary_color = self.settings['secondary_color']
             self.secondary_r_var.set(secondary_color[0])
             self.secondary_g_var.set(secondary_color[1])
             self.secondary_b_var.set(secondary_color[2])
@@ -145,8 +151,7 @@ class LimbusAutoPlayerGUI:
             self.settings_error = str(e)
             
             # Set fallback values
-            script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            self.gui_settings_file = os.path.join(script_dir, 'settings.ini')
+            self.gui_settings_file = get_settings_file()
     
     def apply_initial_theme(self):
         """Apply the initial theme based on settings"""
@@ -165,8 +170,8 @@ class LimbusAutoPlayerGUI:
             self.display_tab.update_info_colors()
             self.display_tab.update_library_colors()
         
-        # Save the theme preference
-        self.save_all_settings(show_message=False)
+        # Save the theme preference (rapid toggles are written once)
+        self.save_all_settings(show_message=False, debounce=True)
         
         # Update config display
         self.update_config_display()
@@ -191,12 +196,14 @@ class LimbusAutoPlayerGUI:
         self.settings_tab = SettingsTab(notebook, self)
         self.display_tab = DisplayTab(notebook, self)
         self.status_tab = StatusTab(notebook, self)
+        self.performance_tab = PerformanceTab(notebook, self)
         
         # Add tabs to notebook
         notebook.add(self.control_tab.frame, text="Control")
         notebook.add(self.settings_tab.frame, text="Settings")
         notebook.add(self.display_tab.frame, text="Display")
         notebook.add(self.status_tab.frame, text="Log")
+        notebook.add(self.performance_tab.frame, text="Performance")
     
     def create_error_display(self):
         """Create error display when settings can't be loaded"""
@@ -269,6 +276,42 @@ class LimbusAutoPlayerGUI:
         secondary_color = (self.secondary_r_var.get(), self.secondary_g_var.get(), self.secondary_b_var.get())
         return target_color, secondary_color
     
+    def bind_run_config_traces(self):
+        """Rebuild the run configuration whenever a setting the worker reads changes"""
+        for var in [self.check_interval_var, self.tolerance_var,
+                   self.target_r_var, self.target_g_var, self.target_b_var,
+                   self.secondary_r_var, self.secondary_g_var, self.secondary_b_var,
+                   self.alt_tab_var, self.reset_cursor_var, self.force_cursor_var,
+                   self.debug_logging_var]:
+            var.trace('w', self.update_run_config)
+    
+    def update_run_config(self, *args):
+        """Build a new immutable run configuration from the GUI variables (main thread only)"""
+        try:
+            target_color, secondary_color = self.get_current_colors()
+            tolerance = self.tolerance_var.get()
+            check_interval = self.check_interval_var.get()
+            
+            # RunConfig gets its matchers from a cache keyed by (colors, tolerance), so they are only rebuilt when those change
+            run_config = RunConfig(
+                check_interval=check_interval,
+                tolerance=tolerance,
+                target_color=target_color,
+                secondary_color=secondary_color,
+                alt_tab_after_click=self.alt_tab_var.get(),
+                reset_cursor_position=self.reset_cursor_var.get(),
+                force_cursor_to_monitor=self.force_cursor_var.get(),
+                debug_logging=self.debug_logging_var.get(),
+                extra_target_colors=self.settings.get('extra_target_colors', ()),
+                extra_secondary_colors=self.settings.get('extra_secondary_colors', ())
+            )
+        except (tk.TclError, ValueError):
+            # Keep the previous configuration while a value is being edited
+            return
+        
+        # A single reference swap, so the worker never sees a half-updated configuration
+        self.run_config = run_config
+    
     def update_config_display(self):
         """Update the configuration display"""
         if hasattr(self, 'control_tab'):
@@ -290,6 +333,7 @@ class LimbusAutoPlayerGUI:
             messagebox.showerror("Error", "Please select a monitor")
             return
             
+        self.update_run_config()
         self.is_running = True
         self.stop_event.clear()
         
@@ -320,25 +364,19 @@ class LimbusAutoPlayerGUI:
     
     def add_status(self, message):
         """Add a status message to the display"""
-        timestamp = time.strftime("%H:%M:%S")
-        full_message = f"[{timestamp}] {message}\n"
-        self.status_queue.put(full_message)
+        self.status_feed.add(message)
     
     def update_status_display(self):
-        """Update status display from queue"""
-        try:
-            while True:
-                message = self.status_queue.get_nowait()
-                if hasattr(self, 'control_tab'):
-                    self.control_tab.add_status_message(message)
-        except queue.Empty:
-            pass
+        """Flush status feed changes to the display in one batch"""
+        batch = self.status_feed.drain()
+        if batch and hasattr(self, 'control_tab'):
+            self.control_tab.add_status_message(*batch)
             
-        self.root.after(100, self.update_status_display)
+        self.root.after(STATUS_FLUSH_MS, self.update_status_display)
     
-    def save_all_settings(self, show_message=True):
-        """Save all settings to file"""
-        self.settings_manager.save_all_settings(self, USE_COMMENT_PRESERVING, show_message)
+    def save_all_settings(self, show_message=True, debounce=False):
+        """Save all settings to file (debounce coalesces rapid saves into one write)"""
+        self.settings_manager.save_all_settings(self, USE_COMMENT_PRESERVING, show_message, debounce)
     
     def debug_display_elements(self):
         """Debug function to check if display elements are working"""
@@ -352,6 +390,11 @@ class LimbusAutoPlayerGUI:
         """Handle window closing"""
         self.save_all_settings(show_message=False)
         
+        # A debounced save (e.g. from a theme change) would be lost when the process exits
+        handler = self.settings.get('_handler')
+        if handler:
+            handler.flush()
+        
         if self.is_running:
             self.stop_detection()
             if self.detection_thread and self.detection_thread.is_alive():
@@ -3,9 +3,12 @@ Limbus Auto Player - Settings Manager
 
 Handles loading and saving of GUI and application settings.
 """
+import io
 import os
 import configparser
 from tkinter import messagebox
+from lib.config import DEFAULTS
+from lib.settings_handler import atomic_write
 from lib.monitor import get_monitor_info
 
 class SettingsManager:
@@ -13,13 +16,10 @@ class SettingsManager:
         pass
     
     def load_gui_settings(self, app):
-        """Load GUI-specific settings from the main settings.ini file"""
-        config = configparser.ConfigParser(interpolation=None)
-        
+        """Load GUI-specific settings from the already loaded settings store"""
         # Default values
         default_monitor = None
-        default_resolution = "1920x1080"
-        default_dark_mode = False  # Default to light mode
+        default_resolution = DEFAULTS['resolution']
         
         # Try to get monitor info, with fallback if it fails
         try:
@@ -35,40 +35,24 @@ class SettingsManager:
                 'is_primary': True
             }]
         
-        # Try to load saved GUI settings from main settings file
-        if os.path.exists(app.gui_settings_file):
-            try:
-                config.read(app.gui_settings_file)
-                
-                if config.has_section('GUI'):
-                    saved_monitor_name = config.get('GUI', 'SELECTED_MONITOR', fallback='')
-                    saved_resolution = config.get('GUI', 'RESOLUTION', fallback=default_resolution)
-                    saved_dark_mode = config.getboolean('GUI', 'DARK_MODE', fallback=default_dark_mode)
-                    
-                    # Set dark mode preference
-                    app.dark_mode_var.set(saved_dark_mode)
-                    
-                    # Try to find the saved monitor
-                    for monitor in app.monitors:
-                        if monitor['name'] == saved_monitor_name:
-                            default_monitor = monitor
-                            break
-                    
-                    if default_monitor:
-                        default_resolution = saved_resolution
-                else:
-                    # GUI section doesn't exist, use defaults and create it
-                    app.dark_mode_var.set(default_dark_mode)
-                    self._create_gui_section_if_missing(app.gui_settings_file)
-                
-            except Exception as e:
-                print(f"Warning: Could not load GUI settings: {e}")
-                # Set to default values
-                app.dark_mode_var.set(default_dark_mode)
-                self._create_gui_section_if_missing(app.gui_settings_file)
-        else:
-            # Settings file doesn't exist, set defaults
-            app.dark_mode_var.set(default_dark_mode)
+        # Values come from the settings parsed at startup; the file is not read again
+        saved_monitor_name = app.settings.get('selected_monitor', DEFAULTS['selected_monitor'])
+        saved_resolution = app.settings.get('resolution', DEFAULTS['resolution'])
+        
+        # Set dark mode preference
+        app.dark_mode_var.set(app.settings.get('dark_mode', DEFAULTS['dark_mode']))
+        
+        # Try to find the saved monitor
+        for monitor in app.monitors:
+            if monitor['name'] == saved_monitor_name:
+                default_monitor = monitor
+                break
+        
+        if default_monitor:
+            default_resolution = saved_resolution
+        
+        # GUI section doesn't exist yet, create it with defaults
+        self._create_gui_section_if_missing(app)
         
         # If no saved monitor or monitor not found, use primary
         if not default_monitor:
@@ -96,33 +80,35 @@ class SettingsManager:
             app.screen_width = default_monitor['width']
             app.screen_height = default_monitor['height']
     
-    def _create_gui_section_if_missing(self, settings_file):
+    def _create_gui_section_if_missing(self, app):
         """Create GUI section with default values if it doesn't exist"""
+        handler = app.settings.get('_handler')
+        if handler is None or 'GUI' in handler.settings:
+            return
+        
         try:
-            config = configparser.ConfigParser(interpolation=None)
+            handler.set('GUI', 'SELECTED_MONITOR', DEFAULTS['selected_monitor'])
+            handler.set('GUI', 'RESOLUTION', DEFAULTS['resolution'])
+            handler.set('GUI', 'DARK_MODE', DEFAULTS['dark_mode'])
+            handler.save()
             
-            # Read existing file if it exists
-            if os.path.exists(settings_file):
-                config.read(settings_file)
+            print("Created GUI section in settings.ini with default values")
             
-            # Add GUI section if it doesn't exist
-            if not config.has_section('GUI'):
-                config.add_section('GUI')
-                config.set('GUI', 'SELECTED_MONITOR', 'Monitor 1')
-                config.set('GUI', 'RESOLUTION', '1920x1080')
-                config.set('GUI', 'DARK_MODE', 'false')
-                
-                # Save the updated file
-                with open(settings_file, 'w') as f:
-                    config.write(f)
-                    
-                print("Created GUI section in settings.ini with default values")
-                
         except Exception as e:
             print(f"Warning: Could not create GUI section: {e}")
     
     def save_gui_settings(self, app):
         """Save GUI-specific settings to the main settings.ini file"""
+        handler = app.settings.get('_handler')
+        if handler is not None:
+            # Only the changed lines are updated; rapid changes are written once
+            if app.selected_monitor:
+                handler.set('GUI', 'SELECTED_MONITOR', app.selected_monitor['name'])
+            handler.set('GUI', 'RESOLUTION', app.resolution_var.get())
+            handler.set('GUI', 'DARK_MODE', app.dark_mode_var.get())
+            handler.save_later()
+            return
+        
         config = configparser.ConfigParser(interpolation=None)
         
         # Read existing settings first to preserve them
@@ -144,18 +130,23 @@ class SettingsManager:
         config.set('GUI', 'DARK_MODE', str(app.dark_mode_var.get()).lower())
         
         try:
-            with open(app.gui_settings_file, 'w') as f:
-                config.write(f)
+            self._write_config(config, app.gui_settings_file)
         except Exception as e:
             print(f"Warning: Could not save GUI settings: {e}")
     
-    def save_all_settings(self, app, use_comment_preserving, show_message=True):
+    def _write_config(self, config, settings_file):
+        """Write a ConfigParser to settings_file through a temp file and rename"""
+        buffer = io.StringIO()
+        config.write(buffer)
+        atomic_write(settings_file, buffer.getvalue())
+    
+    def save_all_settings(self, app, use_comment_preserving, show_message=True, debounce=False):
         """Save all settings (both GUI and detection) to the main settings.ini file"""
         if use_comment_preserving and '_handler' in app.settings:
             # Use the comment-preserving handler
             try:
                 from lib.settings_handler import save_all_settings_with_comments
-                save_all_settings_with_comments(app, show_message)
+                save_all_settings_with_comments(app, show_message, debounce)
             except ImportError:
                 self._fallback_save_all_settings(app, show_message)
         else:
@@ -207,8 +198,7 @@ class SettingsManager:
         config.set('GUI', 'DARK_MODE', str(app.dark_mode_var.get()).lower())
         
         try:
-            with open(app.gui_settings_file, 'w') as f:
-                config.write(f)
+            self._write_config(config, app.gui_settings_file)
             print("All settings saved successfully!")
             if show_message:
                 messagebox.showinfo("Success", "All settings saved successfully!")
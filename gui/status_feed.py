@@ -0,0 +1,95 @@
+"""
+Limbus Auto Player - Status Feed
+
+Bounded status message model shared by the detection thread and the GUI.
+"""
+import re
+import threading
+import time
+from collections import deque
+
+# Most status lines kept (older ones are dropped from the feed and the widget)
+MAX_STATUS_ENTRIES = 200
+
+# How many of the newest entries a message may be merged into
+COALESCE_WINDOW = 4
+
+# Messages that only differ in their numbers are treated as repeats
+NUMBER_PATTERN = re.compile(r'\d+')
+
+
+class StatusEntry:
+    """A single status line, with a counter for merged repeats"""
+
+    __slots__ = ('entry_id', 'key', 'message', 'timestamp', 'count')
+
+    def __init__(self, entry_id, key, message, timestamp):
+        self.entry_id = entry_id
+        self.key = key
+        self.message = message
+        self.timestamp = timestamp
+        self.count = 1
+
+    def format(self):
+        """Get the display text for this entry"""
+        text = f"[{self.timestamp}] {self.message}"
+        if self.count > 1:
+            text += f" ×{self.count}"
+        return text
+
+
+class StatusFeed:
+    """
+    Ring buffer of status messages that merges repeats into counters
+
+    add() can be called from any thread. The GUI calls drain() on a timer
+    and gets every entry that was added or updated since the last drain in
+    one batch, so memory use and redraw work stay bounded no matter how long
+    detection runs. Entry ids increase by one per new entry, which lets the
+    display map an id straight to its line.
+    """
+
+    def __init__(self, max_entries=MAX_STATUS_ENTRIES, coalesce_window=COALESCE_WINDOW):
+        self.entries = deque(maxlen=max(1, max_entries))
+        self.coalesce_window = max(1, coalesce_window)
+        self.lock = threading.Lock()
+        self.next_id = 0
+        self.changed_ids = set()
+
+    def add(self, message):
+        """Add a message, merging it into a recent entry if it is a repeat"""
+        key = NUMBER_PATTERN.sub('#', message)
+        timestamp = time.strftime("%H:%M:%S")
+
+        with self.lock:
+            for index in range(1, min(self.coalesce_window, len(self.entries)) + 1):
+                entry = self.entries[-index]
+                if entry.key == key:
+                    entry.message = message
+                    entry.timestamp = timestamp
+                    entry.count += 1
+                    self.changed_ids.add(entry.entry_id)
+                    return
+
+            entry = StatusEntry(self.next_id, key, message, timestamp)
+            self.next_id += 1
+            self.entries.append(entry)
+            self.changed_ids.add(entry.entry_id)
+
+    def drain(self):
+        """
+        Collect entries changed since the last drain
+
+        Returns:
+            (first_id, updates) where first_id is the oldest entry still kept
+            and updates is a list of (entry_id, text) in id order, or None if
+            nothing changed
+        """
+        with self.lock:
+            if not self.changed_ids:
+                return None
+            changed_ids = self.changed_ids
+            self.changed_ids = set()
+            updates = [(entry.entry_id, entry.format()) for entry in self.entries
+                       if entry.entry_id in changed_ids]
+            return self.entries[0].entry_id, updates
@@ -8,5 +8,6 @@ from .control_tab import ControlTab
 from .settings_tab import SettingsTab
 from .display_tab import DisplayTab
 from .status_tab import StatusTab
+from .performance_tab import PerformanceTab
 
-__all__ = ['ControlTab', 'SettingsTab', 'DisplayTab', 'StatusTab']
\ No newline at end of file
+__all__ = ['ControlTab', 'SettingsTab', 'DisplayTab', 'StatusTab', 'PerformanceTab']
\ No newline at end of file
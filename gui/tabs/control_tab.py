@@ -10,6 +10,9 @@ class ControlTab:
     def __init__(self, parent, app):
         self.app = app
         self.frame = ttk.Frame(parent)
+        # Status feed ids shown on the first and last line of the status display
+        self.status_first_id = None
+        self.status_last_id = None
         self.create_widgets()
     
     def create_widgets(self):
@@ -95,7 +98,41 @@ Debug Logging: {'Yes' if self.app.debug_logging_var.get() else 'No'}"""
             info_color = self.app.theme_manager.get_text_color_for_type('info', is_dark)
             self.hotkey_label.configure(foreground=info_color)
     
-    def add_status_message(self, message):
-        """Add a status message to the status display"""
-        self.status_text.insert(tk.END, message)
-        self.status_text.see(tk.END)
\ No newline at end of file
+    def add_status_message(self, first_id, updates):
+        """
+        Apply a batch of status feed changes to the status display
+
+        Args:
+            first_id: Id of the oldest entry still kept by the feed
+            updates: List of (entry_id, text) for new or updated entries
+        """
+        # Drop lines for entries the feed no longer keeps
+        if self.status_first_id is not None and self.status_first_id < first_id:
+            drop = min(first_id, self.status_last_id + 1) - self.status_first_id
+            self.status_text.delete('1.0', f"{drop + 1}.0")
+            self.status_first_id += drop
+            if self.status_first_id > self.status_last_id:
+                self.status_first_id = self.status_last_id = None
+
+        appended = False
+        for entry_id, text in updates:
+            if self.status_first_id is not None and self.status_first_id <= entry_id <= self.status_last_id:
+                # Merged repeat, rewrite its line in place
+                line = entry_id - self.status_first_id + 1
+                self.status_text.delete(f"{line}.0", f"{line}.end")
+                self.status_text.insert(f"{line}.0", text)
+                continue
+
+            if self.status_last_id is not None and entry_id != self.status_last_id + 1:
+                # Entries were dropped before they were shown, start over
+                self.status_text.delete('1.0', tk.END)
+                self.status_first_id = None
+
+            self.status_text.insert(tk.END, text + "\n")
+            if self.status_first_id is None:
+                self.status_first_id = entry_id
+            self.status_last_id = entry_id
+            appended = True
+
+        if appended:
+            self.status_text.see(tk.END)
\ No newline at end of file
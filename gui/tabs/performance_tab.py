@@ -0,0 +1,176 @@
+"""
+Limbus Auto Player - Performance Tab
+
+Live view of scan rate, stage latencies and click statistics.
+"""
+import time
+import tkinter as tk
+from array import array
+from tkinter import ttk
+
+# Refresh period of the dashboard (milliseconds)
+REFRESH_MS = 1000
+
+# Number of refreshes kept for the sparkline
+HISTORY_LENGTH = 120
+
+SPARKLINE_WIDTH = 480
+SPARKLINE_HEIGHT = 80
+
+# Stages shown in the latency table
+LATENCY_STAGES = ('capture', 'detect', 'click', 'keys', 'scan')
+
+class PerformanceTab:
+    def __init__(self, parent, app):
+        self.app = app
+        self.frame = ttk.Frame(parent)
+
+        # Fixed-size history of scan latency (p95, ms), written as a ring
+        self.history = array('d', [0.0] * HISTORY_LENGTH)
+        self.history_index = 0
+        self.history_count = 0
+
+        self.last_scan_count = 0
+        self.last_refresh = time.perf_counter()
+
+        self.create_widgets()
+        self.app.root.after(REFRESH_MS, self.refresh)
+
+    def create_widgets(self):
+        """Create the performance tab widgets"""
+        # Summary values
+        summary_frame = ttk.LabelFrame(self.frame, text="Session", padding=10)
+        summary_frame.pack(fill='x', pady=(0, 10))
+
+        self.summary_labels = {}
+        summary_items = [
+            ('scans_per_second', "Scans/s:"),
+            ('frame_age', "Frame age:"),
+            ('clicks_per_hour', "Clicks/hour:"),
+            ('missed_deadlines', "Missed deadlines:"),
+            ('skipped_scans', "Unchanged frames:"),
+        ]
+        for index, (key, text) in enumerate(summary_items):
+            row, column = divmod(index, 2)
+            ttk.Label(summary_frame, text=text).grid(row=row, column=column * 2, sticky='w', padx=(0, 5))
+            label = ttk.Label(summary_frame, text="-", width=14)
+            label.grid(row=row, column=column * 2 + 1, sticky='w', padx=(0, 20))
+            self.summary_labels[key] = label
+
+        # Stage latency table
+        latency_frame = ttk.LabelFrame(self.frame, text="Latency (ms)", padding=10)
+        latency_frame.pack(fill='x', pady=(0, 10))
+
+        headers = ["Stage", "Count", "p50", "p95", "p99"]
+        for column, header in enumerate(headers):
+            ttk.Label(latency_frame, text=header, font=('Arial', 9, 'bold')).grid(
+                row=0, column=column, sticky='w', padx=(0, 20))
+
+        self.latency_labels = {}
+        for row, stage in enumerate(LATENCY_STAGES, start=1):
+            ttk.Label(latency_frame, text=stage.capitalize()).grid(row=row, column=0, sticky='w', padx=(0, 20))
+            labels = []
+            for column in range(1, len(headers)):
+                label = ttk.Label(latency_frame, text="-", width=8)
+                label.grid(row=row, column=column, sticky='w', padx=(0, 20))
+                labels.append(label)
+            self.latency_labels[stage] = labels
+
+        # Sparkline of scan latency
+        sparkline_frame = ttk.LabelFrame(self.frame, text="Scan latency p95", padding=10)
+        sparkline_frame.pack(fill='x')
+
+        self.sparkline = tk.Canvas(sparkline_frame, width=SPARKLINE_WIDTH, height=SPARKLINE_HEIGHT,
+                                   highlightthickness=0)
+        self.sparkline.pack(fill='x')
+        self.sparkline_line = self.sparkline.create_line(0, 0, 0, 0, width=1)
+        self.sparkline_max_text = self.sparkline.create_text(2, 2, anchor='nw', text="", font=('Arial', 8))
+
+    def refresh(self):
+        """Update the dashboard and schedule the next refresh"""
+        try:
+            self.update_dashboard()
+        finally:
+            self.app.root.after(REFRESH_MS, self.refresh)
+
+    def update_dashboard(self):
+        """Read the worker's counters and timings and update the widgets"""
+        worker = self.app.detection_worker
+        now = time.perf_counter()
+        elapsed = now - self.last_refresh
+        self.last_refresh = now
+
+        scan_count = worker.scan_count
+        scans = max(0, scan_count - self.last_scan_count)
+        self.last_scan_count = scan_count
+
+        if not self.app.is_running and scans == 0:
+            # Nothing new to show; skip the work while detection is stopped
+            return
+
+        stats = worker.get_timing_stats()
+        scan_p95 = (stats.get('scan') or {}).get('p95_ms') or 0.0
+        self.history[self.history_index] = scan_p95
+        self.history_index = (self.history_index + 1) % HISTORY_LENGTH
+        self.history_count = min(HISTORY_LENGTH, self.history_count + 1)
+
+        # Only redraw what the user can see
+        if not self.frame.winfo_ismapped():
+            return
+
+        self.summary_labels['scans_per_second'].config(text=f"{scans / elapsed:.2f}" if elapsed > 0 else "-")
+
+        frame_age = worker.last_frame_age
+        self.summary_labels['frame_age'].config(text=f"{frame_age * 1000:.1f} ms" if frame_age is not None else "-")
+
+        session_time = time.perf_counter() - worker.session_start if worker.session_start else 0.0
+        clicks_per_hour = worker.click_count * 3600 / session_time if session_time > 0 else 0.0
+        self.summary_labels['clicks_per_hour'].config(text=f"{clicks_per_hour:.1f} ({worker.click_count} total)")
+
+        missed = worker.scheduler.missed_deadlines if worker.scheduler else 0
+        self.summary_labels['missed_deadlines'].config(text=str(missed))
+
+        skipped = worker.skipped_scans
+        skipped_share = skipped * 100 / scan_count if scan_count else 0.0
+        self.summary_labels['skipped_scans'].config(text=f"{skipped} ({skipped_share:.0f}%)")
+
+        for stage, labels in self.latency_labels.items():
+            stage_stats = stats.get(stage)
+            if not stage_stats or not stage_stats['count']:
+                values = ["0", "-", "-", "-"]
+            else:
+                values = [str(stage_stats['count'])] + [
+                    f"{stage_stats[key]:.2f}" for key in ('p50_ms', 'p95_ms', 'p99_ms')
+                ]
+            for label, value in zip(labels, values):
+                label.config(text=value)
+
+        self.draw_sparkline()
+
+    def draw_sparkline(self):
+        """Redraw the sparkline from the latency history"""
+        if self.history_count < 2:
+            return
+
+        # Oldest to newest
+        start = (self.history_index - self.history_count) % HISTORY_LENGTH
+        values = [self.history[(start + i) % HISTORY_LENGTH] for i in range(self.history_count)]
+
+        width = max(self.sparkline.winfo_width(), 2)
+        height = SPARKLINE_HEIGHT
+        peak = max(values) or 1.0
+        step = (width - 1) / (HISTORY_LENGTH - 1)
+        offset = (HISTORY_LENGTH - self.history_count) * step
+
+        coords = []
+        for i, value in enumerate(values):
+            coords.append(offset + i * step)
+            coords.append(height - 2 - (value / peak) * (height - 16))
+        self.sparkline.coords(self.sparkline_line, *coords)
+        self.sparkline.itemconfigure(self.sparkline_max_text, text=f"max {peak:.1f} ms")
+
+    def update_colors(self, theme, line_color):
+        """Apply theme colors to the sparkline canvas"""
+        self.sparkline.configure(bg=theme['text_bg'])
+        self.sparkline.itemconfigure(self.sparkline_line, fill=line_color)
+        self.sparkline.itemconfigure(self.sparkline_max_text, fill=theme['text_fg'])
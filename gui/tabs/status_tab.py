@@ -5,55 +5,193 @@ Interface for viewing debug logs and application status.
 """
 import os
 import tkinter as tk
+from collections import deque
 from tkinter import ttk, scrolledtext
 
+# Most lines kept in memory and shown in the log view
+MAX_LOG_LINES = 2000
+
+# Most new bytes read in one refresh; older data is skipped after long gaps
+MAX_READ_BYTES = 512 * 1024
+
+# Auto refresh period while following the log (milliseconds)
+FOLLOW_INTERVAL_MS = 1000
+
+LOG_LEVELS = ['ALL', 'DEBUG', 'INFO', 'WARNING', 'ERROR']
+
 class StatusTab:
     def __init__(self, parent, app):
         self.app = app
         self.frame = ttk.Frame(parent)
+
+        # Tail-following state
+        self.log_offset = 0
+        self.log_file_id = None
+        self.partial_line = ''
+        self.log_lines = deque(maxlen=MAX_LOG_LINES)
+        self.follow_job = None
+
+        self.level_var = tk.StringVar(value='ALL')
+        self.filter_var = tk.StringVar()
+        self.follow_var = tk.BooleanVar(value=False)
+
         self.create_widgets()
-    
+
     def create_widgets(self):
         """Create the status/log tab widgets"""
         log_frame = ttk.LabelFrame(self.frame, text="Debug Log", padding=10)
         log_frame.pack(fill='both', expand=True)
-        
+
+        # Filters
+        filter_frame = ttk.Frame(log_frame)
+        filter_frame.pack(fill='x', pady=(0, 10))
+
+        ttk.Label(filter_frame, text="Level:").pack(side='left')
+        level_combo = ttk.Combobox(filter_frame, textvariable=self.level_var, values=LOG_LEVELS,
+                                   state='readonly', width=10)
+        level_combo.pack(side='left', padx=(5, 10))
+        level_combo.bind('<<ComboboxSelected>>', lambda e: self.render_log())
+
+        ttk.Label(filter_frame, text="Filter:").pack(side='left')
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var, width=30)
+        filter_entry.pack(side='left', padx=(5, 0), fill='x', expand=True)
+        filter_entry.bind('<KeyRelease>', lambda e: self.render_log())
+
         self.log_text = scrolledtext.ScrolledText(log_frame, height=20)
         self.log_text.pack(fill='both', expand=True)
-        
+
         # Log controls
         log_control_frame = ttk.Frame(log_frame)
         log_control_frame.pack(fill='x', pady=(10, 0))
-        
-        ttk.Button(log_control_frame, text="Clear Log", 
+
+        ttk.Button(log_control_frame, text="Clear Log",
                   command=self.clear_log).pack(side='left')
-        
-        ttk.Button(log_control_frame, text="Refresh Log", 
+
+        ttk.Button(log_control_frame, text="Refresh Log",
                   command=self.refresh_log).pack(side='left', padx=(10, 0))
-    
+
+        ttk.Checkbutton(log_control_frame, text="Follow log",
+                       variable=self.follow_var,
+                       command=self.toggle_follow).pack(side='left', padx=(10, 0))
+
     def clear_log(self):
-        """Clear the debug log display"""
+        """Clear the debug log display (new lines still appear on refresh)"""
+        self.log_lines.clear()
+        self.log_text.delete(1.0, tk.END)
+
+    def show_message(self, message):
+        """Replace the log display with a single message"""
         self.log_text.delete(1.0, tk.END)
-    
+        self.log_text.insert(tk.END, message)
+
+    def line_matches(self, line):
+        """Check a log line against the level and text filters"""
+        level = self.level_var.get()
+        if level != 'ALL' and f" - {level} - " not in line:
+            return False
+        text = self.filter_var.get().strip().lower()
+        return not text or text in line.lower()
+
+    def render_log(self):
+        """Redraw the log display from the lines kept in memory"""
+        lines = [line for line in self.log_lines if self.line_matches(line)]
+        self.log_text.delete(1.0, tk.END)
+        if lines:
+            self.log_text.insert(tk.END, '\n'.join(lines) + '\n')
+        self.log_text.see(tk.END)
+
+    def append_lines(self, lines):
+        """Append new lines to the display, trimming the oldest beyond MAX_LOG_LINES"""
+        self.log_lines.extend(lines)
+
+        shown = [line for line in lines if self.line_matches(line)]
+        if not shown:
+            return
+        self.log_text.insert(tk.END, '\n'.join(shown[-MAX_LOG_LINES:]) + '\n')
+
+        # The widget ends with an empty line after the last newline
+        line_count = int(self.log_text.index('end-1c').split('.')[0]) - 1
+        if line_count > MAX_LOG_LINES:
+            self.log_text.delete(1.0, f"{line_count - MAX_LOG_LINES + 1}.0")
+        self.log_text.see(tk.END)
+
+    def reset_follow_state(self):
+        """Start following the log file from the beginning"""
+        self.log_offset = 0
+        self.log_file_id = None
+        self.partial_line = ''
+        self.log_lines.clear()
+        self.log_text.delete(1.0, tk.END)
+
+    def read_new_lines(self, log_file):
+        """Read lines added to the log file since the last refresh"""
+        stat = os.stat(log_file)
+        file_id = (stat.st_dev, stat.st_ino)
+
+        # The file was rotated or truncated, start over
+        if self.log_file_id is not None and (file_id != self.log_file_id or stat.st_size < self.log_offset):
+            self.reset_follow_state()
+        self.log_file_id = file_id
+
+        if stat.st_size == self.log_offset:
+            return []
+
+        start = self.log_offset
+        skipped = start < stat.st_size - MAX_READ_BYTES
+        if skipped:
+            # Too much new data; only keep the most recent part
+            start = stat.st_size - MAX_READ_BYTES
+
+        with open(log_file, 'rb') as f:
+            f.seek(start)
+            data = f.read(stat.st_size - start)
+        self.log_offset = start + len(data)
+
+        text = data.decode('utf-8', errors='replace')
+        if skipped:
+            # Drop the partial line at the cut
+            text = text.split('\n', 1)[1] if '\n' in text else ''
+            self.partial_line = ''
+
+        text = self.partial_line + text
+        lines = text.split('\n')
+        # Keep an unfinished last line for the next refresh
+        self.partial_line = lines.pop()
+        return [line.rstrip('\r') for line in lines]
+
     def refresh_log(self):
-        """Refresh the debug log from file"""
+        """Show log lines written since the last refresh"""
         if not self.app.debug_logging_var.get():
-            self.log_text.delete(1.0, tk.END)
-            self.log_text.insert(tk.END, "Debug logging is disabled. Enable it in Settings tab.\n")
+            self.reset_follow_state()
+            self.show_message("Debug logging is disabled. Enable it in Settings tab.\n")
             return
-            
+
         log_file = os.path.join(self.app.settings['script_dir'], 'log.txt')
-        
+
         try:
             if os.path.exists(log_file):
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                if self.log_file_id is None:
                     self.log_text.delete(1.0, tk.END)
-                    self.log_text.insert(tk.END, content)
-                    self.log_text.see(tk.END)
+                self.append_lines(self.read_new_lines(log_file))
             else:
-                self.log_text.delete(1.0, tk.END)
-                self.log_text.insert(tk.END, "No log file found. Start detection to create logs.\n")
+                self.reset_follow_state()
+                self.show_message("No log file found. Start detection to create logs.\n")
         except Exception as e:
-            self.log_text.delete(1.0, tk.END)
-            self.log_text.insert(tk.END, f"Error reading log file: {e}\n")
\ No newline at end of file
+            self.reset_follow_state()
+            self.show_message(f"Error reading log file: {e}\n")
+
+    def toggle_follow(self):
+        """Start or stop refreshing the log automatically"""
+        if self.follow_var.get():
+            self.follow_log()
+        elif self.follow_job:
+            self.app.root.after_cancel(self.follow_job)
+            self.follow_job = None
+
+    def follow_log(self):
+        """Refresh the log and schedule the next refresh while following"""
+        self.follow_job = None
+        if not self.follow_var.get():
+            return
+        self.refresh_log()
+        self.follow_job = self.app.root.after(FOLLOW_INTERVAL_MS, self.follow_log)
@@ -198,6 +198,10 @@ class ThemeManager:
                 selectforeground=theme['select_fg']
             )
         
+        if hasattr(self.app, 'performance_tab'):
+            line_color = self.get_text_color_for_type('info', theme == self.dark_theme)
+            self.app.performance_tab.update_colors(theme, line_color)
+        
         # Update info text colors in display tab
         self.update_info_text_colors(theme)
     
@@ -83,6 +83,14 @@ if %errorlevel% neq 0 (
     echo.
 )
 
+echo Installing numpy (for faster detection)...
+pip install numpy
+if %errorlevel% neq 0 (
+    echo Warning: Failed to install numpy (detection will use the slower per-pixel scan)
+    echo The GUI will still work but each scan will use more CPU.
+    echo.
+)
+
 echo.
 echo ====== Installation Complete! ======
 echo.
@@ -0,0 +1,127 @@
+"""
+Background capture thread that keeps the newest frames in a small ring buffer
+"""
+import threading
+import time
+from collections import deque
+from .logger import debug_log
+from .screenshot import take_monitor_screenshot, CaptureSession
+
+
+class FrameRing:
+    """
+    Small ring buffer of captured frames where the latest frame wins
+
+    Each entry is a (timestamp, frame, used_mss) tuple, with timestamps taken
+    from time.perf_counter() right after the grab. Older frames are dropped
+    as new ones arrive.
+    """
+
+    def __init__(self, size=3):
+        self.frames = deque(maxlen=max(1, size))
+        self.condition = threading.Condition()
+
+    def put(self, timestamp, frame, used_mss):
+        """Store a new frame and wake up any waiting consumer"""
+        with self.condition:
+            self.frames.append((timestamp, frame, used_mss))
+            self.condition.notify_all()
+
+    def latest(self):
+        """Get the newest entry, or None if nothing was captured yet"""
+        with self.condition:
+            return self.frames[-1] if self.frames else None
+
+    def wait_for_newer(self, newer_than, timeout):
+        """
+        Wait for a frame captured after newer_than
+
+        Returns:
+            The newest entry, or None if no newer frame arrived within timeout
+        """
+        deadline = time.perf_counter() + timeout
+        with self.condition:
+            while not self.frames or self.frames[-1][0] <= newer_than:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return None
+                self.condition.wait(remaining)
+            return self.frames[-1]
+
+    def clear(self):
+        """Drop all stored frames"""
+        with self.condition:
+            self.frames.clear()
+
+
+class BackgroundCapture:
+    """
+    Producer thread that captures a monitor region at a target rate
+
+    The detector takes the newest frame from the ring buffer instead of
+    waiting on its own grab, so capture latency is hidden and every frame
+    carries its capture time for frame age measurements.
+    """
+
+    def __init__(self, monitor, screen_width, screen_height, region=None, capture_rate=10.0, buffer_size=3):
+        self.monitor = monitor
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.region = region
+        self.capture_interval = 1.0 / max(0.1, capture_rate)
+        self.ring = FrameRing(buffer_size)
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.frames_captured = 0
+        self.last_error = None
+
+    def start(self):
+        """Start the capture thread"""
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        debug_log("Background capture started at %.1f fps", 1.0 / self.capture_interval)
+
+    def stop(self, timeout=1.0):
+        """Stop the capture thread and wait for it to finish"""
+        self.stop_event.set()
+        if self.thread and self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join(timeout=timeout)
+        self.thread = None
+        debug_log("Background capture stopped after %d frames", self.frames_captured)
+
+    def run(self):
+        """Capture loop, runs in the producer thread"""
+        # The session is opened here because mss handles belong to the thread that opened them
+        with CaptureSession() as session:
+            next_capture = time.perf_counter()
+            while not self.stop_event.is_set():
+                try:
+                    frame, used_mss = take_monitor_screenshot(
+                        self.monitor, self.screen_width, self.screen_height,
+                        region=self.region, session=session
+                    )
+                    self.ring.put(time.perf_counter(), frame, used_mss)
+                    self.frames_captured += 1
+                    self.last_error = None
+                except Exception as e:
+                    self.last_error = e
+                    debug_log("Background capture error: %s", e)
+
+                # Keep a fixed rate; skip ahead instead of bursting after a slow grab
+                next_capture += self.capture_interval
+                now = time.perf_counter()
+                if next_capture < now:
+                    next_capture = now
+                self.stop_event.wait(next_capture - now)
+
+    def get_frame(self, newer_than, timeout):
+        """
+        Get the newest frame captured after newer_than
+
+        Returns:
+            (timestamp, frame, used_mss) tuple, or None on timeout
+        """
+        return self.ring.wait_for_newer(newer_than, timeout)
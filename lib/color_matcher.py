@@ -0,0 +1,118 @@
+"""
+Precompiled color matching using per-channel lookup tables
+"""
+from functools import lru_cache
+from .library_checker import is_available, lazy_import
+
+# Import numpy if available (loaded on first use)
+if is_available('numpy'):
+    np = lazy_import('numpy')
+
+# Position of the red, green and blue channels for each supported channel order
+CHANNEL_INDEXES = {
+    'RGB': (0, 1, 2),
+    'RGBA': (0, 1, 2),
+    'BGRA': (2, 1, 0),
+}
+
+
+# Colors one matcher can hold (one bit per color in a uint64 table entry)
+MAX_PALETTE_SIZE = 64
+
+
+def build_palette(color, extra_colors=()):
+    """
+    Combine a color with extra acceptable colors
+
+    Returns:
+        The color itself when there are no (new) extra colors, otherwise a
+        tuple of RGB tuples starting with the color
+    """
+    palette = [tuple(color)]
+    for extra in extra_colors:
+        if tuple(extra) not in palette:
+            palette.append(tuple(extra))
+    return palette[0] if len(palette) == 1 else tuple(palette)
+
+
+class ColorMatcher:
+    """
+    Color matcher compiled once from a palette of colors and a tolerance
+
+    Each channel gets a 256-entry table of bitmasks with bit i set for every
+    channel value within tolerance of color i. A pixel matches when the masks
+    of its three channels share a bit, so a match is three table lookups and
+    two ANDs no matter how many colors the palette has, both for a single
+    pixel and for whole arrays of pixels.
+
+    Args:
+        colors: One (R, G, B) color or a sequence of up to MAX_PALETTE_SIZE colors
+        tolerance: Maximum difference per channel
+    """
+
+    def __init__(self, colors, tolerance):
+        if isinstance(colors[0], int):
+            colors = (colors,)
+        if len(colors) > MAX_PALETTE_SIZE:
+            raise ValueError(f"at most {MAX_PALETTE_SIZE} colors can be matched at once, got {len(colors)}")
+        self.colors = tuple(tuple(int(c) for c in color[:3]) for color in colors)
+        self.color = self.colors[0]
+        self.tolerance = int(tolerance)
+
+        self.tables = [
+            [
+                sum(1 << index for index, color in enumerate(self.colors) if abs(value - color[channel]) <= self.tolerance)
+                for value in range(256)
+            ]
+            for channel in range(3)
+        ]
+
+        self._np_tables = None
+
+    @property
+    def np_tables(self):
+        """Lookup tables as numpy arrays (built on first use), or None without numpy"""
+        if self._np_tables is None and is_available('numpy'):
+            if len(self.colors) == 1:
+                # A single color needs no bitmask; boolean tables skip the final compare
+                dtype = bool
+            else:
+                dtype = next(dtype for dtype in (np.uint8, np.uint16, np.uint32, np.uint64)
+                             if np.iinfo(dtype).bits >= len(self.colors))
+            self._np_tables = [np.array(table, dtype=dtype) for table in self.tables]
+        return self._np_tables
+
+    def matches(self, pixel):
+        """Check if a single (R, G, B[, A]) pixel matches any color of the palette"""
+        r_table, g_table, b_table = self.tables
+        return (r_table[pixel[0]] & g_table[pixel[1]] & b_table[pixel[2]]) != 0
+
+    def match_array(self, pixels, channel_order='RGB'):
+        """
+        Match a uint8 array of pixels with the color channels in the last axis
+
+        Args:
+            pixels: Array in the given channel order (e.g. a BGRA frame view)
+            channel_order: One of CHANNEL_INDEXES
+
+        Returns:
+            Boolean array with the last axis removed
+        """
+        r_index, g_index, b_index = CHANNEL_INDEXES[channel_order]
+        r_table, g_table, b_table = self.np_tables
+        mask = r_table[pixels[..., r_index]] & g_table[pixels[..., g_index]] & b_table[pixels[..., b_index]]
+        return mask if mask.dtype == bool else mask != 0
+
+    def __repr__(self):
+        colors = ', '.join(f"RGB{color}" for color in self.colors)
+        return f"ColorMatcher({colors}, tolerance={self.tolerance})"
+
+
+@lru_cache(maxsize=16)
+def get_color_matcher(colors, tolerance):
+    """
+    Get a compiled matcher, only building a new one when the colors or tolerance change
+
+    colors is one (R, G, B) tuple or a tuple of them (see build_palette()).
+    """
+    return ColorMatcher(colors, tolerance)
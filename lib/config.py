@@ -1,75 +1,208 @@
 import os
 
+
+def parse_color_list(value):
+    """Parse a list of colors written as 'R,G,B; R,G,B' into a tuple of RGB tuples"""
+    if isinstance(value, (tuple, list)):
+        return tuple(tuple(color) for color in value)
+    colors = []
+    for part in str(value).split(';'):
+        if not part.strip():
+            continue
+        color = tuple(int(channel) for channel in part.split(','))
+        if len(color) != 3 or not all(0 <= channel <= 255 for channel in color):
+            raise ValueError(f"not an R,G,B color: {part.strip()}")
+        colors.append(color)
+    return tuple(colors)
+
+# Every setting read from settings.ini with its type and default value.
+# This is the only place defaults are defined; the GUI, the detection loop and
+# the headless runner all get their values through build_settings().
+# (name, section, key, type, default)
+SETTINGS_SCHEMA = (
+    ('check_row_percentage', 'DETECTION', 'CHECK_ROW_PERCENTAGE', float, 74.17),
+    ('x_start_from_center', 'DETECTION', 'X_START_FROM_CENTER', int, -1),
+    ('x_end_at_edge', 'DETECTION', 'X_END_AT_EDGE', int, -1),
+    ('tolerance', 'DETECTION', 'TOLERANCE', int, 10),
+    ('extra_target_colors', 'DETECTION', 'EXTRA_TARGET_COLORS', parse_color_list, ()),
+    ('extra_secondary_colors', 'DETECTION', 'EXTRA_SECONDARY_COLORS', parse_color_list, ()),
+    ('search_area_size', 'DETECTION', 'SEARCH_AREA_SIZE', int, 50),
+    ('secondary_min_match_fraction', 'DETECTION', 'SECONDARY_MIN_MATCH_FRACTION', float, 0.0),
+    ('min_button_width', 'DETECTION', 'MIN_BUTTON_WIDTH', int, 10),
+    ('scan_stride', 'DETECTION', 'SCAN_STRIDE', int, 0),
+    ('skip_unchanged_frames', 'DETECTION', 'SKIP_UNCHANGED_FRAMES', bool, True),
+    ('use_hit_cache', 'DETECTION', 'USE_HIT_CACHE', bool, True),
+    ('check_interval', 'TIMING', 'CHECK_INTERVAL', float, 1.0),
+    ('schedule_mode', 'TIMING', 'SCHEDULE_MODE', str, 'fixed_rate'),
+    ('capture_mode', 'CAPTURE', 'CAPTURE_MODE', str, 'strip'),
+    ('background_capture', 'CAPTURE', 'BACKGROUND_CAPTURE', bool, False),
+    ('capture_rate', 'CAPTURE', 'CAPTURE_RATE', float, 10.0),
+    ('capture_buffer_size', 'CAPTURE', 'CAPTURE_BUFFER_SIZE', int, 3),
+    ('alt_tab_after_click', 'BEHAVIOR', 'ALT_TAB_AFTER_CLICK', bool, False),
+    ('reset_cursor_position', 'BEHAVIOR', 'RESET_CURSOR_POSITION', bool, True),
+    ('force_cursor_to_monitor', 'BEHAVIOR', 'FORCE_CURSOR_TO_MONITOR', bool, False),
+    ('debug_logging', 'DEBUG', 'DEBUG_LOGGING', bool, False),
+    ('log_max_size_mb', 'DEBUG', 'LOG_MAX_SIZE_MB', float, 5.0),
+    ('log_backup_count', 'DEBUG', 'LOG_BACKUP_COUNT', int, 3),
+    ('selected_monitor', 'GUI', 'SELECTED_MONITOR', str, 'Monitor 1'),
+    ('resolution', 'GUI', 'RESOLUTION', str, '1920x1080'),
+    ('dark_mode', 'GUI', 'DARK_MODE', bool, False),  # Default to light mode
+)
+
+# RGB colors stored as <KEY>_R, <KEY>_G and <KEY>_B
+# (name, section, key prefix, default)
+COLOR_SCHEMA = (
+    ('target_color', 'DETECTION', 'TARGET_COLOR', (59, 1, 0)),
+    ('secondary_color', 'DETECTION', 'SECONDARY_COLOR', (246, 175, 100)),
+)
+
+DEFAULTS = {name: default for name, _, _, _, default in SETTINGS_SCHEMA}
+DEFAULTS.update({name: default for name, _, _, default in COLOR_SCHEMA})
+
+# Extra detection profiles are [PROFILE <name>] sections. They accept the
+# [DETECTION] keys of these settings (and the colors); keys left out use the
+# [DETECTION] value.
+PROFILE_SECTION_PREFIX = 'PROFILE '
+PROFILE_SETTINGS = (
+    'check_row_percentage', 'x_start_from_center', 'x_end_at_edge', 'tolerance', 'search_area_size',
+    'secondary_min_match_fraction', 'min_button_width', 'scan_stride', 'extra_target_colors',
+    'extra_secondary_colors',
+)
+
+# Extra colors belonging to each base color. A profile that sets its own base
+# color does not inherit the [DETECTION] extra colors for it, since those are
+# shades of a different button.
+PROFILE_EXTRA_COLORS = {
+    'target_color': 'extra_target_colors',
+    'secondary_color': 'extra_secondary_colors',
+}
+
+# What happens when a profile's button is found
+# click_enter = click, then press Enter; click = click only; enter = press Enter only
+PROFILE_ACTIONS = ('click_enter', 'click', 'enter')
+
+# The profile built from [DETECTION] itself
+DEFAULT_PROFILE_NAME = 'win_rate'
+
+
+def get_settings_file():
+    """Path of settings.ini in the folder above lib/"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(os.path.dirname(script_dir), 'settings.ini')
+
+
+def convert_value(value, value_type, default):
+    """
+    Convert a value read from settings.ini to the setting's type
+
+    Returns:
+        The converted value, or default if value is missing or invalid
+    """
+    if value is None:
+        return default
+    try:
+        if value_type is bool:
+            if isinstance(value, str):
+                value = value.strip().lower()
+                if value not in ('true', 'false', 'yes', 'no', 'on', 'off', '1', '0'):
+                    raise ValueError(f"not a boolean: {value}")
+                return value in ('true', 'yes', 'on', '1')
+            return bool(value)
+        if value_type is int:
+            return int(float(value))
+        return value_type(value)
+    except (TypeError, ValueError) as e:
+        print(f"Warning: invalid setting value {value!r} ({e}), using {default!r}")
+        return default
+
+
+def build_settings(get_value):
+    """
+    Build the typed settings dict
+
+    Args:
+        get_value: Function (section, key) -> value from settings.ini, or None if missing
+
+    Returns:
+        Dict with every setting in SETTINGS_SCHEMA and COLOR_SCHEMA plus script_dir
+    """
+    settings = {'script_dir': os.path.dirname(os.path.abspath(__file__))}
+
+    for name, section, key, value_type, default in SETTINGS_SCHEMA:
+        settings[name] = convert_value(get_value(section, key), value_type, default)
+
+    for name, section, prefix, default in COLOR_SCHEMA:
+        settings[name] = read_color(get_value, section, prefix, default)
+
+    return settings
+
+
+def read_color(get_value, section, prefix, default):
+    """Read an RGB color stored as <prefix>_R, <prefix>_G and <prefix>_B"""
+    return tuple(
+        max(0, min(255, convert_value(get_value(section, f"{prefix}_{channel}"), int, channel_default)))
+        for channel, channel_default in zip('RGB', default)
+    )
+
+
+def build_profile_settings(settings, sections, get_value):
+    """
+    Build the settings of each extra detection profile
+
+    Args:
+        settings: Settings dict from build_settings(), used for keys a profile leaves out
+        sections: Section names in settings.ini, in file order
+        get_value: Function (section, key) -> value from settings.ini, or None if missing
+
+    Returns:
+        List of dicts with name, action and the PROFILE_SETTINGS and colors,
+        for every [PROFILE <name>] section that is not disabled with ENABLED = false.
+        A profile that sets a target or secondary color gets no extra colors
+        for it unless it also sets EXTRA_TARGET_COLORS / EXTRA_SECONDARY_COLORS.
+    """
+    profiles = []
+    for section in sections:
+        if not section.upper().startswith(PROFILE_SECTION_PREFIX):
+            continue
+        name = section[len(PROFILE_SECTION_PREFIX):].strip().lower()
+        if not name or name == DEFAULT_PROFILE_NAME:
+            print(f"Warning: ignoring detection profile section [{section}], it needs a name other than {DEFAULT_PROFILE_NAME!r}")
+            continue
+        if not convert_value(get_value(section, 'ENABLED'), bool, True):
+            continue
+
+        profile = {'name': name}
+        for setting_name, _, key, value_type, _ in SETTINGS_SCHEMA:
+            if setting_name in PROFILE_SETTINGS:
+                profile[setting_name] = convert_value(get_value(section, key), value_type, settings[setting_name])
+        for setting_name, _, prefix, _ in COLOR_SCHEMA:
+            profile[setting_name] = read_color(get_value, section, prefix, settings[setting_name])
+            overrides_color = any(get_value(section, f"{prefix}_{channel}") is not None for channel in 'RGB')
+            extra_name = PROFILE_EXTRA_COLORS[setting_name]
+            extra_key = next(key for name, _, key, _, _ in SETTINGS_SCHEMA if name == extra_name)
+            if overrides_color and get_value(section, extra_key) is None:
+                profile[extra_name] = ()
+
+        action = str(get_value(section, 'ACTION') or PROFILE_ACTIONS[0]).strip().lower()
+        if action not in PROFILE_ACTIONS:
+            print(f"Warning: unknown ACTION {action!r} in [{section}], using {PROFILE_ACTIONS[0]!r}")
+            action = PROFILE_ACTIONS[0]
+        profile['action'] = action
+        profiles.append(profile)
+
+    return profiles
+
+
 def load_settings():
     """Safely load settings without allowing sys.exit() to terminate the GUI"""
-    import configparser
-    
-    # Get the directory where the script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    # Get the parent directory
-    parent_dir = os.path.dirname(script_dir)
-    settings_file = os.path.join(parent_dir, 'settings.ini')
-    
+    settings_file = get_settings_file()
+
     # Check if settings.ini exists
     if not os.path.exists(settings_file):
         raise Exception(f"settings.ini not found at: {settings_file}")
-    
+
     try:
-        config = configparser.ConfigParser()
-        config.read(settings_file)
-        
-        # Load debug setting first
-        debug_logging = config.getboolean('DEBUG', 'DEBUG_LOGGING', fallback=False)
-        
-        # Load colors
-        target_r = config.getint('DETECTION', 'TARGET_COLOR_R', fallback=59)
-        target_g = config.getint('DETECTION', 'TARGET_COLOR_G', fallback=1)
-        target_b = config.getint('DETECTION', 'TARGET_COLOR_B', fallback=0)
-        target_color = (target_r, target_g, target_b)
-        
-        secondary_r = config.getint('DETECTION', 'SECONDARY_COLOR_R', fallback=246)
-        secondary_g = config.getint('DETECTION', 'SECONDARY_COLOR_G', fallback=175)
-        secondary_b = config.getint('DETECTION', 'SECONDARY_COLOR_B', fallback=100)
-        secondary_color = (secondary_r, secondary_g, secondary_b)
-        
-        # Load other detection settings
-        check_row_percentage = config.getfloat('DETECTION', 'CHECK_ROW_PERCENTAGE', fallback=74.17)
-        x_start_from_center = config.getint('DETECTION', 'X_START_FROM_CENTER', fallback=-1)
-        x_end_at_edge = config.getint('DETECTION', 'X_END_AT_EDGE', fallback=-1)
-        tolerance = config.getint('DETECTION', 'TOLERANCE', fallback=10)
-        search_area_size = config.getint('DETECTION', 'SEARCH_AREA_SIZE', fallback=50)
-        
-        # Load timing settings
-        check_interval = config.getfloat('TIMING', 'CHECK_INTERVAL', fallback=2.0)
-
-        # Load behavior settings
-        alt_tab_after_click = config.getboolean('BEHAVIOR', 'ALT_TAB_AFTER_CLICK', fallback=False)
-        reset_cursor_position = config.getboolean('BEHAVIOR', 'RESET_CURSOR_POSITION', fallback=True)
-        force_cursor_to_monitor = config.getboolean('BEHAVIOR', 'FORCE_CURSOR_TO_MONITOR', fallback=True)
-        
-        # Load GUI settings (with defaults)
-        selected_monitor = config.get('GUI', 'SELECTED_MONITOR', fallback='Monitor 1')
-        resolution = config.get('GUI', 'RESOLUTION', fallback='1920x1080')
-        dark_mode = config.getboolean('GUI', 'DARK_MODE', fallback=False)  # Default to light mode
-        
-        return {
-            'script_dir': script_dir,
-            'debug_logging': debug_logging,
-            'check_row_percentage': check_row_percentage,
-            'x_start_from_center': x_start_from_center,
-            'x_end_at_edge': x_end_at_edge,
-            'target_color': target_color,
-            'secondary_color': secondary_color,
-            'tolerance': tolerance,
-            'search_area_size': search_area_size,
-            'check_interval': check_interval,
-            'alt_tab_after_click': alt_tab_after_click,
-            'reset_cursor_position': reset_cursor_position,
-            'force_cursor_to_monitor': force_cursor_to_monitor,
-            'selected_monitor': selected_monitor,
-            'resolution': resolution,
-            'dark_mode': dark_mode
-        }
-        
+        from .settings_handler import load_settings_with_comments
+        return load_settings_with_comments()
     except Exception as e:
         raise Exception(f"Error reading settings.ini: {e}")
@@ -1,47 +1,283 @@
-from .logger import debug_log
+from .logger import debug_log, is_debug_enabled
+from .library_checker import is_available, lazy_import
+from .color_matcher import get_color_matcher, build_palette
+from .frame import as_frame
+from .config import DEFAULTS
+
+# Import numpy if available (loaded on first use)
+if is_available('numpy'):
+    np = lazy_import('numpy')
+
+# Every n-th row of the search area is included in the scan strip fingerprint
+# (the scan row itself always is)
+FINGERPRINT_ROW_STEP = 4
 
 def color_match(c1, c2, tol):
     """Check if two colors match within tolerance"""
     return all(abs(a - b) <= tol for a, b in zip(c1, c2))
 
-def check_secondary_color(screenshot, center_x, center_y, secondary_color, tolerance, search_area_size, used_mss):
-    """Check if secondary color exists in search area around center point"""
+def get_scan_stride(scan_stride, min_button_width):
+    """
+    Pixel step of the coarse row scan
+    
+    0 (or less) uses the minimum button width. Larger strides are capped at
+    the minimum button width so every run wide enough to be the button still
+    covers at least one sampled pixel.
+    """
+    min_button_width = max(1, min_button_width)
+    if scan_stride <= 0:
+        return min_button_width
+    return min(scan_stride, min_button_width)
+
+def find_row_runs(frame, row_y, x_start, x_end, target_matcher, stride=1):
+    """
+    Find runs of adjacent pixels on a screenshot row that match the target color
+    
+    Args:
+        frame: Frame to scan
+        row_y: Row to scan, in screenshot coordinates
+        x_start, x_end: Scan range in screenshot coordinates (end is exclusive)
+        target_matcher: ColorMatcher for the target color
+        stride: Check every stride-th pixel first, then every pixel between
+            and around matching samples. Runs at least stride pixels wide are
+            found exactly as with stride 1; narrower runs may be missed.
+    
+    Returns:
+        List of (run_start, run_end) x coordinates (inclusive) ordered right to left
+    """
+    # Clamp the scan range to the screenshot
+    x_start = max(0, x_start)
+    x_end = min(frame.size[0], x_end)
+    if x_start >= x_end or row_y < 0 or row_y >= frame.size[1]:
+        return []
+    
+    if stride > 1:
+        return find_row_runs_strided(frame, row_y, x_start, x_end, target_matcher, stride)
+    
+    if is_available('numpy'):
+        # Compare every pixel of the scan row in a single operation
+        row = frame.region(x_start, row_y, x_end, row_y + 1)[0]
+        matches = np.flatnonzero(target_matcher.match_array(row, frame.channel_order)) + x_start
+        if not len(matches):
+            return []
+        
+        # Split wherever consecutive matches are not adjacent
+        breaks = np.flatnonzero(np.diff(matches) != 1)
+        run_starts = np.concatenate(([matches[0]], matches[breaks + 1]))
+        run_ends = np.concatenate((matches[breaks], [matches[-1]]))
+        return list(zip(run_starts[::-1].tolist(), run_ends[::-1].tolist()))
+    
+    # Fallback: per-pixel scan from right to left
+    runs = []
+    run_end = None
+    for x in range(x_end - 1, x_start - 2, -1):
+        matched = x >= x_start and target_matcher.matches(frame.getpixel((x, row_y)))
+        if matched and run_end is None:
+            run_end = x
+        elif not matched and run_end is not None:
+            runs.append((x + 1, run_end))
+            run_end = None
+    return runs
+
+def find_row_runs_strided(frame, row_y, x_start, x_end, target_matcher, stride):
+    """Coarse-to-fine version of find_row_runs for an already clamped scan range"""
+    # Coarse pass: every stride-th pixel
+    if is_available('numpy'):
+        row = frame.region(x_start, row_y, x_end, row_y + 1)[0][::stride]
+        hits = (np.flatnonzero(target_matcher.match_array(row, frame.channel_order)) * stride + x_start).tolist()
+    else:
+        hits = [x for x in range(x_start, x_end, stride) if target_matcher.matches(frame.getpixel((x, row_y)))]
+    if not hits:
+        return []
+    
+    def matches(x):
+        return target_matcher.matches(frame.getpixel((x, row_y)))
+    
+    # Fine pass over each group of adjacent matching samples: every pixel
+    # between the samples is checked (gaps there split the group into runs),
+    # and the outer runs are extended up to the non-matching samples next to them
+    runs = []
+    group_start = group_end = hits[0]
+    for x in hits[1:] + [None]:
+        if x is not None and x == group_end + stride:
+            group_end = x
+            continue
+        # Right to left; the outer samples match, so the first run ends at
+        # group_end and the last one starts at group_start
+        group_runs = find_row_runs(frame, row_y, group_start, group_end + 1, target_matcher)
+        
+        run_start, run_end = group_runs[0]
+        while run_end + 1 < x_end and run_end + 1 < group_end + stride and matches(run_end + 1):
+            run_end += 1
+        group_runs[0] = (run_start, run_end)
+        
+        run_start, run_end = group_runs[-1]
+        while run_start - 1 >= x_start and run_start - 1 > group_start - stride and matches(run_start - 1):
+            run_start -= 1
+        group_runs[-1] = (run_start, run_end)
+        
+        runs.extend(reversed(group_runs))
+        group_start = group_end = x
+    
+    runs.reverse()
+    return runs
+
+def probe_known_runs(frame, row_y, x_start, x_end, known_runs, target_matcher, min_button_width=1):
+    """
+    Check remembered run positions with a few pixel reads each
+    
+    A position passes when the pixels at both ends and the center of the run
+    match the target color on the scan row.
+    
+    Args:
+        frame: Frame to check
+        row_y: Scan row, in screenshot coordinates
+        x_start, x_end: Scan range in screenshot coordinates (end is exclusive)
+        known_runs: (run_start, run_end) x coordinates in screenshot coordinates
+        target_matcher: ColorMatcher for the target color
+        min_button_width: Narrower runs are ignored
+    
+    Returns:
+        List of the (run_start, run_end) positions that passed, in the given order
+    """
+    x_start = max(0, x_start)
+    x_end = min(frame.size[0], x_end)
+    if row_y < 0 or row_y >= frame.size[1]:
+        return []
+    
+    runs = []
+    for run_start, run_end in known_runs:
+        if run_start < x_start or run_end >= x_end or run_end - run_start + 1 < min_button_width:
+            continue
+        if all(target_matcher.matches(frame.getpixel((x, row_y)))
+               for x in (run_start, (run_start + run_end) // 2, run_end)):
+            runs.append((run_start, run_end))
+    return runs
+
+def check_secondary_color(frame, center_x, center_y, secondary_matcher, search_area_size, used_mss,
+                          min_match_fraction=0.0, run_bounds=None):
+    """
+    Check if secondary color exists in search area around center point
+    
+    When min_match_fraction is above zero, at least that fraction of the
+    pixels in the search_area_size square around the center must match the
+    secondary color. Otherwise a single matching pixel is enough, and when
+    run_bounds (run_start, run_end) is given the search area spans the whole
+    run plus half the search area on each side.
+    """
     half_size = search_area_size // 2
+    # The density is always measured over the square, so the threshold does not depend on the button width
+    if run_bounds and min_match_fraction <= 0:
+        run_start, run_end = run_bounds
+    else:
+        run_start, run_end = center_x, center_x
     
     # Calculate search boundaries
-    start_x = max(0, center_x - half_size)
-    end_x = min(screenshot.size[0], center_x + half_size)
+    start_x = max(0, run_start - half_size)
+    end_x = min(frame.size[0], run_end + half_size)
     start_y = max(0, center_y - half_size)
-    end_y = min(screenshot.size[1], center_y + half_size)
+    end_y = min(frame.size[1], center_y + half_size)
     
-    debug_log(f"Secondary color search area: X{start_x}-{end_x}, Y{start_y}-{end_y}")
-    debug_log(f"Center point: X{center_x}, Y{center_y}")
-    debug_log(f"Screenshot method: {'mss' if used_mss else 'pyautogui'}")
+    debug = is_debug_enabled()
+    if debug:
+        debug_log("Secondary color search area: X%d-%d, Y%d-%d", start_x, end_x, start_y, end_y)
+        debug_log("Center point: X%d, Y%d", center_x, center_y)
+        debug_log("Screenshot method: %s", 'mss' if used_mss else 'pyautogui')
     
-    # Search for secondary color in the area
-    colors_found = []
-    for x in range(start_x, end_x, 2):  # Step by 2 for faster scanning
-        for y in range(start_y, end_y, 2):
-            try:
-                pixel_color = screenshot.getpixel((x, y))
-                colors_found.append(pixel_color)
-                if color_match(pixel_color, secondary_color, tolerance):
-                    debug_log(f"Found secondary color at X{x}, Y{y}: {pixel_color}")
-                    return True
-            except (IndexError, OSError):
-                continue
-    
-    # Show some sample colors for debugging
-    if colors_found:
-        sample_colors = colors_found[::len(colors_found)//5] if len(colors_found) > 5 else colors_found
-        debug_log(f"Sample colors in search area: {sample_colors[:5]}")
-    debug_log("Secondary color not found in search area")
+    if start_x >= end_x or start_y >= end_y:
+        debug_log("Secondary color search area is empty")
+        return False
+    
+    if is_available('numpy'):
+        # Check the whole search area as one array
+        window = frame.region(start_x, start_y, end_x, end_y)
+        mask = secondary_matcher.match_array(window, frame.channel_order)
+        match_count = int(np.count_nonzero(mask))
+        total_count = mask.size
+        
+        if match_count and debug:
+            y, x = np.argwhere(mask)[0].tolist()
+            debug_log("Found secondary color at X%d, Y%d: %s", start_x + x, start_y + y,
+                      frame.getpixel((start_x + x, start_y + y)))
+    else:
+        # Fallback: sample every other pixel
+        match_count = 0
+        total_count = 0
+        for x in range(start_x, end_x, 2):  # Step by 2 for faster scanning
+            for y in range(start_y, end_y, 2):
+                try:
+                    pixel_color = frame.getpixel((x, y))
+                except (IndexError, OSError):
+                    continue
+                total_count += 1
+                if secondary_matcher.matches(pixel_color):
+                    if not match_count:
+                        debug_log("Found secondary color at X%d, Y%d: %s", x, y, pixel_color)
+                    match_count += 1
+                    if min_match_fraction <= 0:
+                        return True
+    
+    if match_count and total_count:
+        match_fraction = match_count / total_count
+        if match_fraction >= min_match_fraction:
+            debug_log("Secondary color matched %d/%d pixels (%.1f%%)", match_count, total_count, match_fraction * 100)
+            return True
+        debug_log("Secondary color density too low: %.1f%% < %.1f%%", match_fraction * 100, min_match_fraction * 100)
+    
+    # Show some sample colors for debugging (only built when debug logging is on)
+    if debug:
+        sample_colors = [frame.getpixel((x, center_y)) for x in range(start_x, end_x, max(1, (end_x - start_x) // 5))][:5]
+        debug_log("Sample colors in search area: %s", sample_colors)
+        debug_log("Secondary color not found in search area")
     return False
 
-def detect_button(screenshot, used_mss, detection_settings, monitor_settings, resolution_info=None):
+def get_screenshot_offset(used_mss, monitor_settings, capture_origin=None):
+    """
+    Offset from monitor-relative coordinates to screenshot coordinates
+    
+    mss screenshots start at capture_origin on the monitor (or its top-left
+    corner); pyautogui screenshots are the full desktop, so the monitor's
+    position has to be added.
+    """
+    if used_mss:
+        origin_x, origin_y = capture_origin or (0, 0)
+        return -origin_x, -origin_y
+    return monitor_settings['monitor_offset_x'], monitor_settings['monitor_offset_y']
+
+def scan_strip_fingerprint(screenshot, used_mss, detection_settings, monitor_settings, capture_origin=None,
+                           row_step=FINGERPRINT_ROW_STEP):
+    """
+    Cheap fingerprint of the screen area detect_button reads
+    
+    Covers the scan row and every row_step-th row of the search area around
+    it, across the scan range plus half the search area on each side. Equal
+    fingerprints mean detection would see the same pixels on those rows.
+    
+    Returns:
+        Integer checksum
+    """
+    frame = as_frame(screenshot)
+    offset_x, offset_y = get_screenshot_offset(used_mss, monitor_settings, capture_origin)
+    half_size = detection_settings['search_area_size'] // 2
+    
+    row = detection_settings['check_row_relative'] + offset_y
+    rows = [row] + [y for y in range(row - half_size, row + half_size + 1, max(1, row_step)) if y != row]
+    left = detection_settings['x_start_relative'] - half_size + offset_x
+    right = detection_settings['x_end_relative'] + half_size + offset_x
+    
+    return frame.fingerprint(rows, left, right)
+
+def detect_button(screenshot, used_mss, detection_settings, monitor_settings, resolution_info=None,
+                  capture_origin=None, hit_cache=None):
     """
     Main button detection function with simplified coordinate logic
+    
+    screenshot may be a Frame or a PIL image. capture_origin is the (x, y) position of an mss screenshot's top-left
+    pixel relative to the monitor, when only part of the monitor was captured. When a HitCache is given, its
+    remembered positions are checked before the full row scan and confirmed hits are recorded in it.
     """
+    frame = as_frame(screenshot)
+    
     # Extract settings
     x_start_relative = detection_settings['x_start_relative']
     x_end_relative = detection_settings['x_end_relative']
@@ -50,6 +286,18 @@ def detect_button(screenshot, used_mss, detection_settings, monitor_settings, re
     secondary_color = detection_settings['secondary_color']
     tolerance = detection_settings['tolerance']
     search_area_size = detection_settings['search_area_size']
+    # Settings left out of a partial dict use the shared defaults
+    min_match_fraction = detection_settings.get('secondary_min_match_fraction', DEFAULTS['secondary_min_match_fraction'])
+    min_button_width = detection_settings.get('min_button_width', DEFAULTS['min_button_width'])
+    scan_stride = get_scan_stride(detection_settings.get('scan_stride', DEFAULTS['scan_stride']), min_button_width)
+    
+    # Compiled matchers are passed in by the worker; build (cached) ones otherwise
+    target_matcher = detection_settings.get('target_matcher') or get_color_matcher(
+        build_palette(target_color, detection_settings.get('extra_target_colors', DEFAULTS['extra_target_colors'])), tolerance
+    )
+    secondary_matcher = detection_settings.get('secondary_matcher') or get_color_matcher(
+        build_palette(secondary_color, detection_settings.get('extra_secondary_colors', DEFAULTS['extra_secondary_colors'])), tolerance
+    )
     
     monitor_offset_x = monitor_settings['monitor_offset_x']
     monitor_offset_y = monitor_settings['monitor_offset_y']
@@ -61,105 +309,112 @@ def detect_button(screenshot, used_mss, detection_settings, monitor_settings, re
         screen_width = resolution_info.get('screen_width', 0)
         screen_height = resolution_info.get('screen_height', 0)
     else:
-        monitor_width = screen_width = screenshot.size[0]
-        monitor_height = screen_height = screenshot.size[1]
+        monitor_width = screen_width = frame.size[0]
+        monitor_height = screen_height = frame.size[1]
     
-    debug_log(f"=== DETECTION START ===")
-    debug_log(f"Screenshot size: {screenshot.size[0]}x{screenshot.size[1]}")
-    debug_log(f"Monitor: {monitor_width}x{monitor_height} at offset ({monitor_offset_x}, {monitor_offset_y})")
-    debug_log(f"Screen resolution: {screen_width}x{screen_height}")
-    debug_log(f"Search range: X{x_start_relative}-{x_end_relative}, Y{check_row_relative}")
-    debug_log(f"Screenshot method: {'MSS (cropped)' if used_mss else 'PyAutoGUI (full desktop)'}")
+    debug = is_debug_enabled()
+    if debug:
+        debug_log("=== DETECTION START ===")
+        debug_log("Screenshot size: %dx%d", frame.size[0], frame.size[1])
+        debug_log("Monitor: %dx%d at offset (%d, %d)", monitor_width, monitor_height, monitor_offset_x, monitor_offset_y)
+        debug_log("Screen resolution: %dx%d", screen_width, screen_height)
+        debug_log("Search range: X%d-%d, Y%d", x_start_relative, x_end_relative, check_row_relative)
+        debug_log("Screenshot method: %s", 'MSS (cropped)' if used_mss else 'PyAutoGUI (full desktop)')
+        if used_mss and capture_origin:
+            debug_log("Screenshot origin on monitor: %s", capture_origin)
     
     # Determine if we need to apply scaling
     needs_scaling = (monitor_width != screen_width or monitor_height != screen_height)
     if needs_scaling:
         scale_x = monitor_width / screen_width
         scale_y = monitor_height / screen_height
-        debug_log(f"Scaling needed: scale_x={scale_x}, scale_y={scale_y}")
+        debug_log("Scaling needed: scale_x=%s, scale_y=%s", scale_x, scale_y)
     else:
         scale_x = scale_y = 1.0
         debug_log("No scaling needed - monitor matches screen resolution")
     
-    # Scan from right to left
-    for x in range(x_end_relative - 1, x_start_relative - 1, -1):
+    # Screenshot coordinates of the scan row
+    # MSS: coordinates are within the cropped screenshot
+    # pyautogui: need absolute coordinates for full desktop screenshot
+    screenshot_offset_x, screenshot_offset_y = get_screenshot_offset(used_mss, monitor_settings, capture_origin)
+    coords_desc = "MSS screenshot coords" if used_mss else "PyAutoGUI desktop coords"
+    screenshot_y = check_row_relative + screenshot_offset_y
+    
+    scan_x_start = x_start_relative + screenshot_offset_x
+    scan_x_end = x_end_relative + screenshot_offset_x
+    
+    def iter_candidate_runs():
+        """Remembered positions that still match first, then the runs found by scanning the row"""
+        probed = []
+        if hit_cache is not None:
+            known_runs = [(start + screenshot_offset_x, end + screenshot_offset_x) for start, end in hit_cache.positions()]
+            try:
+                probed = probe_known_runs(frame, screenshot_y, scan_x_start, scan_x_end, known_runs,
+                                          target_matcher, min_button_width)
+            except (IndexError, OSError) as e:
+                debug_log("Pixel access error: %s", e)
+            debug_log("Hit cache: %d of %d remembered positions match the target color", len(probed), len(known_runs))
+            yield from probed
+        
+        try:
+            runs = find_row_runs(frame, screenshot_y, scan_x_start, scan_x_end, target_matcher, scan_stride)
+        except (IndexError, OSError) as e:
+            debug_log("Pixel access error: %s", e)
+            runs = []
+        
+        # Drop runs too narrow to be the button (stray pixels, thin UI lines) and runs already checked
+        candidate_runs = [(start, end) for start, end in runs if end - start + 1 >= min_button_width]
+        debug_log("Target color runs on scan row: %d (%d at least %dpx wide)", len(runs), len(candidate_runs), min_button_width)
+        yield from (run for run in candidate_runs if run not in probed)
+    
+    # Check each run once at its center: remembered positions first, then right to left
+    for run_start, run_end in iter_candidate_runs():
         try:
-            # Get pixel color based on screenshot method
-            if used_mss:
-                # MSS: coordinates are within the cropped screenshot
-                if x >= screenshot.size[0] or check_row_relative >= screenshot.size[1]:
-                    continue
-                pixel_color = screenshot.getpixel((x, check_row_relative))
-                pixel_location_desc = f"MSS screenshot coords ({x}, {check_row_relative})"
+            screenshot_x = (run_start + run_end) // 2
+            x = screenshot_x - screenshot_offset_x
+            debug_log("Found target color run at %s X%d-%d, Y%d", coords_desc, run_start, run_end, screenshot_y)
+            
+            # Calculate click coordinates: apply scaling to relative coordinates, then add monitor offset
+            if needs_scaling:
+                scaled_x = x * scale_x
+                scaled_y = check_row_relative * scale_y
+                click_x = int(scaled_x) + monitor_offset_x
+                click_y = int(scaled_y) + monitor_offset_y
+                debug_log("With scaling: relative(%d, %d) -> scaled(%s, %s) -> final(%d, %d)",
+                          x, check_row_relative, scaled_x, scaled_y, click_x, click_y)
             else:
-                # pyautogui: need absolute coordinates for full desktop screenshot
-                abs_x = x + monitor_offset_x
-                abs_y = check_row_relative + monitor_offset_y
-                if abs_x >= screenshot.size[0] or abs_y >= screenshot.size[1] or abs_x < 0 or abs_y < 0:
-                    continue
-                pixel_color = screenshot.getpixel((abs_x, abs_y))
-                pixel_location_desc = f"PyAutoGUI desktop coords ({abs_x}, {abs_y})"
+                click_x = x + monitor_offset_x
+                click_y = check_row_relative + monitor_offset_y
+                debug_log("No scaling: relative(%d, %d) -> final(%d, %d)", x, check_row_relative, click_x, click_y)
             
-            # Check if target color matches
-            if color_match(pixel_color, target_color, tolerance):
-                debug_log(f"Found target color at {pixel_location_desc}: {pixel_color}")
-                
-                # Calculate click coordinates
-                if used_mss:
-                    # MSS: apply scaling to screenshot coordinates, then add monitor offset
-                    if needs_scaling:
-                        scaled_x = x * scale_x
-                        scaled_y = check_row_relative * scale_y
-                        click_x = int(scaled_x) + monitor_offset_x
-                        click_y = int(scaled_y) + monitor_offset_y
-                        debug_log(f"MSS with scaling: ({x}, {check_row_relative}) -> scaled({scaled_x}, {scaled_y}) -> final({click_x}, {click_y})")
-                    else:
-                        click_x = x + monitor_offset_x
-                        click_y = check_row_relative + monitor_offset_y
-                        debug_log(f"MSS no scaling: ({x}, {check_row_relative}) -> final({click_x}, {click_y})")
-                    
-                    # Secondary color check uses screenshot coordinates
-                    screenshot_x = x
-                    screenshot_y = check_row_relative
-                    
-                else:
-                    # pyautogui: apply scaling to relative coordinates, then add monitor offset
-                    if needs_scaling:
-                        scaled_x = x * scale_x
-                        scaled_y = check_row_relative * scale_y
-                        click_x = int(scaled_x) + monitor_offset_x
-                        click_y = int(scaled_y) + monitor_offset_y
-                        debug_log(f"PyAutoGUI with scaling: relative({x}, {check_row_relative}) -> scaled({scaled_x}, {scaled_y}) -> final({click_x}, {click_y})")
-                    else:
-                        click_x = x + monitor_offset_x
-                        click_y = check_row_relative + monitor_offset_y
-                        debug_log(f"PyAutoGUI no scaling: relative({x}, {check_row_relative}) -> final({click_x}, {click_y})")
-                    
-                    # Secondary color check uses absolute coordinates in full desktop screenshot
-                    screenshot_x = x + monitor_offset_x
-                    screenshot_y = check_row_relative + monitor_offset_y
-                
-                # Validate click coordinates
-                debug_log(f"Click coordinates validation:")
-                debug_log(f"  - Target monitor bounds: X{monitor_offset_x}-{monitor_offset_x + monitor_width}, Y{monitor_offset_y}-{monitor_offset_y + monitor_height}")
-                debug_log(f"  - Click coordinates: ({click_x}, {click_y})")
-                debug_log(f"  - Within monitor bounds: X={monitor_offset_x <= click_x <= monitor_offset_x + monitor_width}, Y={monitor_offset_y <= click_y <= monitor_offset_y + monitor_height}")
-                
-                # Check for secondary color
-                secondary_found = check_secondary_color(
-                    screenshot, screenshot_x, screenshot_y, secondary_color, 
-                    tolerance, search_area_size, used_mss
-                )
+            # Validate click coordinates
+            if debug:
+                debug_log("Click coordinates validation:")
+                debug_log("  - Target monitor bounds: X%d-%d, Y%d-%d", monitor_offset_x, monitor_offset_x + monitor_width,
+                          monitor_offset_y, monitor_offset_y + monitor_height)
+                debug_log("  - Click coordinates: (%d, %d)", click_x, click_y)
+                debug_log("  - Within monitor bounds: X=%s, Y=%s",
+                          monitor_offset_x <= click_x <= monitor_offset_x + monitor_width,
+                          monitor_offset_y <= click_y <= monitor_offset_y + monitor_height)
+            
+            # Check for secondary color (uses screenshot coordinates)
+            secondary_found = check_secondary_color(
+                frame, screenshot_x, screenshot_y, secondary_matcher,
+                search_area_size, used_mss, min_match_fraction,
+                run_bounds=(run_start, run_end)
+            )
+            
+            if secondary_found:
+                debug_log("✅ Secondary color confirmed! Button detected.")
+                debug_log("🎯 FINAL CLICK COORDINATES: (%d, %d)", click_x, click_y)
+                if hit_cache is not None:
+                    hit_cache.record(run_start - screenshot_offset_x, run_end - screenshot_offset_x)
+                return True, click_x, click_y
+            else:
+                debug_log("❌ Target color found but secondary color not detected")
                 
-                if secondary_found:
-                    debug_log("✅ Secondary color confirmed! Button detected.")
-                    debug_log(f"🎯 FINAL CLICK COORDINATES: ({click_x}, {click_y})")
-                    return True, click_x, click_y
-                else:
-                    debug_log("❌ Target color found but secondary color not detected")
-                    
         except (IndexError, OSError) as e:
-            debug_log(f"Pixel access error: {e}")
+            debug_log("Pixel access error: %s", e)
             continue
     
     # No button found
@@ -0,0 +1,315 @@
+"""
+Capture, detect and click loop shared by the GUI worker and the headless runner
+"""
+import time
+from .logger import setup_logging, shutdown_logging, debug_log
+from .screenshot import take_monitor_screenshot, CaptureSession
+from .background_capture import BackgroundCapture
+from .scheduler import ScanScheduler
+from .detection_profiles import create_profiles, DetectionEngine
+from .mouse import smart_click
+from .stage_timing import StageTimings
+from .config import DEFAULTS
+
+# How often the stage timing summary is written to the debug log (seconds)
+TIMING_LOG_INTERVAL = 60.0
+
+
+class DetectionLoop:
+    """
+    Runs scans until stop_event is set
+
+    The loop only reads plain settings and an immutable RunConfig, so it does
+    not depend on Tk. Subclasses (or callers) provide the current RunConfig
+    through get_run_config() and receive status messages through add_status().
+
+    Args:
+        settings: Loaded settings dict
+        monitor: Monitor dict (x, y, width, height, name)
+        screen_width, screen_height: Resolution used for detection
+        stop_event: threading.Event that ends the loop
+        run_config: RunConfig used for every scan
+        status_callback: Called with each status message, or None
+        scan_status: Whether per-scan progress messages are reported
+    """
+
+    def __init__(self, settings=None, monitor=None, screen_width=1920, screen_height=1080,
+                 stop_event=None, run_config=None, status_callback=None, scan_status=True):
+        self.settings = settings
+        self.monitor = monitor
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.stop_event = stop_event
+        self.run_config = run_config
+        self.status_callback = status_callback
+        self.scan_status = scan_status
+        self.capture_session = None
+        self.background_capture = None
+        self.last_frame_age = None
+        self.scheduler = None
+        self.engine = None
+        self.timings = StageTimings()
+        # Session counters (shown by the GUI Performance tab)
+        self.scan_count = 0
+        self.click_count = 0
+        self.skipped_scans = 0
+        # Buttons found per detection profile name
+        self.profile_hits = {}
+        self.session_start = None
+        # Exception that ended the last run early, or None
+        self.error = None
+    
+    def setting(self, name):
+        """Get a setting, falling back to the shared default if it is missing"""
+        return self.settings.get(name, DEFAULTS[name])
+    
+    def get_run_config(self):
+        """Get the RunConfig to use for the next scan"""
+        return self.run_config
+    
+    def add_status(self, message):
+        """Report a status message"""
+        if self.status_callback:
+            self.status_callback(message)
+    
+    def get_timing_stats(self):
+        """
+        Get rolling per-stage timings of the current (or last) session
+        
+        Returns:
+            Dict keyed by stage (capture, detect, click, keys, scan) with count,
+            mean_ms, last_ms, p50_ms, p95_ms, p99_ms and max_ms
+        """
+        return self.timings.summary()
+    
+    def log_timing_summary(self):
+        """Write the stage timing summary to the debug log"""
+        summary = self.timings.format_summary()
+        if summary:
+            debug_log("Stage timings:\n%s", summary)
+    
+    def capture_frame(self, capture_region, newer_than):
+        """
+        Get a frame to run detection on
+        
+        With background capture this is the newest buffered frame captured
+        after newer_than; otherwise a screenshot is taken right now.
+        
+        Returns:
+            (screenshot, used_mss, captured_at) tuple, screenshot is None if no
+            new frame arrived in time
+        """
+        if self.background_capture:
+            timeout = max(1.0, 3 * self.background_capture.capture_interval)
+            entry = self.background_capture.get_frame(newer_than, timeout)
+            if entry is None:
+                return None, False, newer_than
+            captured_at, screenshot, used_mss = entry
+            return screenshot, used_mss, captured_at
+        
+        screenshot, used_mss = take_monitor_screenshot(
+            self.monitor, self.screen_width, self.screen_height,
+            region=capture_region, session=self.capture_session
+        )
+        return screenshot, used_mss, time.perf_counter()
+    
+    def perform_action(self, profile, click_x, click_y, config):
+        """Click and/or press Enter for a profile whose button was found"""
+        if profile.clicks:
+            with self.timings.measure('click'):
+                smart_click(
+                    click_x, click_y,
+                    target_monitor=self.monitor,
+                    force_cursor_to_monitor=config.force_cursor_to_monitor,
+                    restore_cursor=config.reset_cursor_position
+                )
+        
+        # Key timings leave out the fixed sleeps
+        import keyboard
+        keys_time = 0.0
+        if profile.presses_enter:
+            time.sleep(0.1)
+            keys_start = time.perf_counter()
+            keyboard.press_and_release('enter')
+            keys_time += time.perf_counter() - keys_start
+        
+        # Optional Alt+Tab
+        if config.alt_tab_after_click:
+            time.sleep(0.2)
+            keys_start = time.perf_counter()
+            keyboard.press_and_release('alt+tab')
+            keys_time += time.perf_counter() - keys_start
+        if profile.presses_enter or config.alt_tab_after_click:
+            self.timings.record('keys', keys_time)
+    
+    def run(self):
+        """
+        Run scans until stop_event is set
+        
+        An exception that ends the run is reported as a status message and
+        kept in self.error.
+        """
+        self.error = None
+        try:
+            # Immutable settings snapshot; a new one may be swapped in between scans
+            config = self.get_run_config()
+            
+            # Setup logging
+            setup_logging(
+                config.debug_logging, self.settings['script_dir'],
+                max_size_mb=self.setting('log_max_size_mb'),
+                backup_count=self.setting('log_backup_count')
+            )
+            
+            monitor_settings = {
+                'monitor_offset_x': self.monitor['x'],
+                'monitor_offset_y': self.monitor['y']
+            }
+            
+            # Prepare resolution info for scaling decisions
+            resolution_info = {
+                'monitor_width': self.monitor['width'],
+                'monitor_height': self.monitor['height'],
+                'screen_width': self.screen_width,
+                'screen_height': self.screen_height
+            }
+            
+            # The [DETECTION] profile and any [PROFILE <name>] ones, all checked on each frame
+            profiles = create_profiles(
+                self.settings, self.monitor, self.screen_width, self.screen_height,
+                use_hit_cache=self.setting('use_hit_cache')
+            )
+            self.engine = DetectionEngine(
+                profiles, monitor_settings, resolution_info,
+                skip_unchanged=self.setting('skip_unchanged_frames')
+            )
+            self.engine.update_config(config)
+            if len(profiles) > 1:
+                self.add_status(f"🧩 Detection profiles: {', '.join(profile.name for profile in profiles)}")
+            
+            # Capture only the strips detection reads unless full frames are requested
+            if self.setting('capture_mode') == 'full':
+                capture_region = None
+            else:
+                capture_region = self.engine.get_capture_region(self.screen_width, self.screen_height)
+            
+            if self.setting('background_capture'):
+                # Capture continuously in a producer thread and use the newest frame
+                self.background_capture = BackgroundCapture(
+                    self.monitor, self.screen_width, self.screen_height,
+                    region=capture_region,
+                    capture_rate=self.setting('capture_rate'),
+                    buffer_size=self.setting('capture_buffer_size')
+                )
+                self.background_capture.start()
+            else:
+                # Open the capture session once and reuse it for every scan
+                self.capture_session = CaptureSession()
+                self.capture_session.open()
+            
+            # Scans are timed against absolute deadlines so CHECK_INTERVAL does not drift
+            self.scheduler = ScanScheduler(
+                config.check_interval, self.stop_event,
+                mode=self.setting('schedule_mode')
+            )
+            self.scheduler.start()
+            
+            self.timings.reset()
+            self.scan_count = 0
+            self.click_count = 0
+            self.skipped_scans = 0
+            self.profile_hits = {}
+            self.session_start = time.perf_counter()
+            next_timing_log = time.perf_counter() + TIMING_LOG_INTERVAL
+            
+            scan_count = 0
+            last_frame_time = 0.0
+            
+            while not self.stop_event.is_set():
+                # Pick up settings changed since the last scan
+                current_config = self.get_run_config()
+                if current_config is not config:
+                    config = current_config
+                    self.engine.update_config(config)
+                
+                scan_count += 1
+                self.scan_count = scan_count
+                if self.scan_status:
+                    self.add_status(f"🔍 Scan #{scan_count}...")
+                
+                scan_start = time.perf_counter()
+                try:
+                    # Take screenshot (or the newest background frame)
+                    with self.timings.measure('capture'):
+                        screenshot, used_mss, captured_at = self.capture_frame(capture_region, last_frame_time)
+                    # Without a new frame there is nothing to detect, but the scan still waits for its deadline
+                    if screenshot is None:
+                        self.add_status("⚠️ No new frame from background capture")
+                    else:
+                        last_frame_time = captured_at
+                        self.last_frame_age = time.perf_counter() - captured_at
+                        debug_log("Frame age: %.1f ms", self.last_frame_age * 1000)
+                        
+                        # Strip captures start at the region origin; pyautogui falls back to the full desktop
+                        capture_origin = (capture_region['left'], capture_region['top']) if capture_region else None
+                        
+                        # Check every profile against this frame
+                        with self.timings.measure('detect'):
+                            result = self.engine.detect(screenshot, used_mss, capture_origin=capture_origin)
+                        if self.engine.last_scan_skipped:
+                            self.skipped_scans += 1
+                        
+                        if result:
+                            profile, click_x, click_y = result
+                            self.profile_hits[profile.name] = self.profile_hits.get(profile.name, 0) + 1
+                            self.add_status(f"✅ Button detected ({profile.name})! {'Clicking' if profile.clicks else 'Pressing Enter'}...")
+                            
+                            self.perform_action(profile, click_x, click_y, config)
+                            
+                            self.click_count += 1
+                            if profile.clicks:
+                                self.add_status(f"🎯 Button clicked successfully! ({profile.name})")
+                            else:
+                                self.add_status(f"🎯 Enter pressed ({profile.name})")
+                            
+                            self.engine.save_hit_caches()
+                            
+                            # Only use frames captured after the click for the next scan
+                            last_frame_time = time.perf_counter()
+                            
+                        else:
+                            if self.scan_status:
+                                self.add_status("❌ Button not found in this scan")
+                            
+                except Exception as e:
+                    if self.engine:
+                        self.engine.reset()
+                    self.add_status(f"⚠️ Error in scan #{scan_count}: {e}")
+                
+                self.timings.record('scan', time.perf_counter() - scan_start)
+                if scan_start >= next_timing_log:
+                    self.log_timing_summary()
+                    next_timing_log = scan_start + TIMING_LOG_INTERVAL
+                    
+                # Wait for next scan (returns at once when stop is requested)
+                if self.scheduler.wait(self.get_run_config().check_interval):
+                    break
+                
+        except Exception as e:
+            self.error = e
+            self.add_status(f"💥 Detection error: {e}")
+        finally:
+            # Closed from the loop's thread since mss handles belong to the thread that opened them
+            if self.capture_session:
+                self.capture_session.close()
+                self.capture_session = None
+            if self.background_capture:
+                self.background_capture.stop()
+                self.background_capture = None
+            if self.engine:
+                self.engine.save_hit_caches()
+                self.engine = None
+            self.log_timing_summary()
+            # Write out queued log messages so the log file holds the whole session;
+            # messages logged after the run still go to log.txt
+            shutdown_logging(keep_file_logging=True)
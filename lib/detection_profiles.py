@@ -0,0 +1,205 @@
+"""
+Named detection profiles evaluated together on one captured frame
+"""
+from .config import DEFAULTS, DEFAULT_PROFILE_NAME, PROFILE_ACTIONS
+from .color_matcher import get_color_matcher, build_palette
+from .detection import detect_button, scan_strip_fingerprint
+from .frame import as_frame
+from .hit_cache import HitCache
+from .logger import debug_log
+from .screenshot import get_scan_strip_region, merge_regions
+
+
+def build_detection_settings(values, screen_width, screen_height):
+    """
+    Get the detect_button settings of a profile in screen pixels
+
+    Args:
+        values: Settings dict or profile dict from config.build_profile_settings()
+        screen_width, screen_height: Resolution used for detection
+
+    Returns:
+        Detection settings dict with compiled color matchers
+    """
+    def value(name):
+        return values.get(name, DEFAULTS[name])
+
+    check_row_relative = int((value('check_row_percentage') / 100) * screen_height)
+    x_start_relative = int(screen_width / 2) if value('x_start_from_center') == -1 else value('x_start_from_center')
+    x_end_relative = screen_width if value('x_end_at_edge') == -1 else value('x_end_at_edge')
+
+    return {
+        'x_start_relative': x_start_relative,
+        'x_end_relative': x_end_relative,
+        'check_row_relative': check_row_relative,
+        'target_color': value('target_color'),
+        'secondary_color': value('secondary_color'),
+        'tolerance': value('tolerance'),
+        'target_matcher': get_color_matcher(
+            build_palette(value('target_color'), value('extra_target_colors')), value('tolerance')
+        ),
+        'secondary_matcher': get_color_matcher(
+            build_palette(value('secondary_color'), value('extra_secondary_colors')), value('tolerance')
+        ),
+        'search_area_size': value('search_area_size'),
+        'secondary_min_match_fraction': value('secondary_min_match_fraction'),
+        'min_button_width': value('min_button_width'),
+        'scan_stride': value('scan_stride'),
+    }
+
+
+class DetectionProfile:
+    """
+    One button to look for and what to do when it is found
+
+    Args:
+        name: Profile name shown in status messages
+        action: One of config.PROFILE_ACTIONS
+        detection_settings: Settings from build_detection_settings()
+        hit_cache: HitCache of this profile, or None
+    """
+
+    def __init__(self, name, action, detection_settings, hit_cache=None):
+        self.name = name
+        self.action = action if action in PROFILE_ACTIONS else PROFILE_ACTIONS[0]
+        self.settings = detection_settings
+        self.hit_cache = hit_cache
+        # Fingerprint of the last strip without this profile's button
+        self.last_fingerprint = None
+
+    @property
+    def clicks(self):
+        """Whether the action clicks the button"""
+        return self.action in ('click_enter', 'click')
+
+    @property
+    def presses_enter(self):
+        """Whether the action presses Enter"""
+        return self.action in ('click_enter', 'enter')
+
+    def __repr__(self):
+        return f"DetectionProfile({self.name!r}, action={self.action!r})"
+
+
+def create_profiles(settings, monitor, screen_width, screen_height, use_hit_cache=False):
+    """
+    Build the default [DETECTION] profile followed by the [PROFILE <name>] ones
+
+    Args:
+        settings: Loaded settings dict (profiles in settings['profiles'])
+        monitor: Monitor dict, used for the hit cache keys
+        screen_width, screen_height: Resolution used for detection
+        use_hit_cache: Whether each profile remembers where its button was found
+
+    Returns:
+        List of DetectionProfile in the order they are checked
+    """
+    profile_values = [dict(settings, name=DEFAULT_PROFILE_NAME, action=PROFILE_ACTIONS[0])]
+    profile_values.extend(settings.get('profiles', ()))
+
+    profiles = []
+    for values in profile_values:
+        name = values['name']
+        hit_cache = None
+        if use_hit_cache:
+            # The default profile keeps the key it had before profiles existed
+            hit_cache = HitCache.for_monitor(
+                settings['script_dir'], monitor, screen_width, screen_height,
+                profile=None if name == DEFAULT_PROFILE_NAME else name
+            )
+        profiles.append(DetectionProfile(
+            name, values['action'], build_detection_settings(values, screen_width, screen_height), hit_cache
+        ))
+    return profiles
+
+
+class DetectionEngine:
+    """
+    Checks every detection profile against the same frame
+
+    Profiles are checked in order and the first one whose button is found
+    wins, so one capture serves all of them. With skip_unchanged, a profile
+    whose strip has the same fingerprint as the last time its button was not
+    found is skipped.
+
+    Args:
+        profiles: List of DetectionProfile, the default profile first
+        monitor_settings: Monitor offset dict for detect_button
+        resolution_info: Monitor and screen size dict for detect_button
+        skip_unchanged: Whether unchanged strips are skipped
+    """
+
+    def __init__(self, profiles, monitor_settings, resolution_info, skip_unchanged=True):
+        self.profiles = profiles
+        self.monitor_settings = monitor_settings
+        self.resolution_info = resolution_info
+        self.skip_unchanged = skip_unchanged
+        # True when every profile was skipped on the last detect() call
+        self.last_scan_skipped = False
+
+    def update_config(self, config):
+        """Use the colors and tolerance of a new RunConfig for the default profile"""
+        for profile in self.profiles:
+            if profile.name == DEFAULT_PROFILE_NAME:
+                profile.settings.update({
+                    'target_color': config.target_color,
+                    'secondary_color': config.secondary_color,
+                    'tolerance': config.tolerance,
+                    'target_matcher': config.target_matcher,
+                    'secondary_matcher': config.secondary_matcher,
+                })
+                profile.last_fingerprint = None
+
+    def reset(self):
+        """Forget all fingerprints so every profile is checked on the next frame"""
+        for profile in self.profiles:
+            profile.last_fingerprint = None
+
+    def get_capture_region(self, screen_width, screen_height):
+        """Region of the monitor covering the strips of all profiles"""
+        return merge_regions([
+            get_scan_strip_region(profile.settings, screen_width, screen_height)
+            for profile in self.profiles
+        ])
+
+    def detect(self, screenshot, used_mss, capture_origin=None):
+        """
+        Look for the button of each profile in one frame
+
+        Returns:
+            (profile, click_x, click_y) of the first profile whose button was
+            found, or None
+        """
+        frame = as_frame(screenshot)
+        self.last_scan_skipped = True
+
+        for profile in self.profiles:
+            fingerprint = None
+            if self.skip_unchanged:
+                fingerprint = scan_strip_fingerprint(
+                    frame, used_mss, profile.settings, self.monitor_settings,
+                    capture_origin=capture_origin
+                )
+                if fingerprint == profile.last_fingerprint:
+                    debug_log("Profile %s: scan strip unchanged, reusing previous result", profile.name)
+                    continue
+
+            self.last_scan_skipped = False
+            debug_log("Checking profile %s", profile.name)
+            button_found, click_x, click_y = detect_button(
+                frame, used_mss, profile.settings, self.monitor_settings, self.resolution_info,
+                capture_origin=capture_origin, hit_cache=profile.hit_cache
+            )
+            if button_found:
+                # A visible button is always rescanned
+                profile.last_fingerprint = None
+                return profile, click_x, click_y
+            profile.last_fingerprint = fingerprint
+
+        return None
+
+    def save_hit_caches(self):
+        """Write the hit caches that changed"""
+        for profile in self.profiles:
+            if profile.hit_cache:
+                profile.hit_cache.save()
@@ -0,0 +1,112 @@
+"""
+Captured frame that detection can read without converting it to a PIL image
+"""
+import zlib
+from .library_checker import is_available, lazy_import
+
+# PIL is only needed when a frame is converted to an image
+Image = lazy_import('PIL.Image')
+
+# Import numpy if available (loaded on first use)
+if is_available('numpy'):
+    np = lazy_import('numpy')
+
+
+class Frame:
+    """
+    A captured frame backed either by a raw BGRA buffer or by a PIL image
+
+    Frames grabbed with mss wrap the raw buffer directly: pixels are read as a
+    numpy view of that buffer and the BGRA channel order is handled when colors
+    are compared, so no copy or reorder happens per scan. A PIL image is only
+    built if something (debug dump, preview) asks for one.
+    """
+
+    def __init__(self, size, buffer=None, image=None, channel_order='BGRA'):
+        self.size = (int(size[0]), int(size[1]))
+        self.buffer = buffer
+        self.channel_order = channel_order
+        self._image = image
+        self._pixels = None
+
+    @classmethod
+    def from_mss(cls, screenshot_data):
+        """Wrap an mss screenshot without copying its pixels"""
+        return cls(screenshot_data.size, buffer=screenshot_data.raw, channel_order='BGRA')
+
+    @classmethod
+    def from_image(cls, image):
+        """Wrap a PIL image (e.g. a pyautogui screenshot)"""
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return cls(image.size, image=image, channel_order='RGB')
+
+    @property
+    def pixels(self):
+        """Whole frame as a height x width x channels numpy array"""
+        if self._pixels is None:
+            if self.buffer is not None:
+                width, height = self.size
+                self._pixels = np.frombuffer(self.buffer, dtype=np.uint8).reshape(height, width, 4)
+            else:
+                self._pixels = np.asarray(self._image)
+        return self._pixels
+
+    def region(self, left, top, right, bottom):
+        """Pixels in a region as a numpy array, in the frame's channel order"""
+        if self.buffer is not None:
+            return self.pixels[top:bottom, left:right]
+        # Image-backed frames only convert the requested region
+        return np.asarray(self._image.crop((left, top, right, bottom)))
+
+    def getpixel(self, xy):
+        """Get a single pixel as an (R, G, B) tuple"""
+        x, y = xy
+        width, height = self.size
+        if not (0 <= x < width and 0 <= y < height):
+            raise IndexError(f"pixel ({x}, {y}) outside {width}x{height} frame")
+
+        if self.buffer is not None:
+            offset = (y * width + x) * 4
+            return (self.buffer[offset + 2], self.buffer[offset + 1], self.buffer[offset])
+        return self._image.getpixel(xy)[:3]
+
+    def fingerprint(self, rows, left, right):
+        """
+        CRC32 of the given rows between left and right (exclusive)
+
+        Used to tell whether the part of the screen detection reads changed
+        since the last frame. Rows outside the frame are ignored.
+        """
+        width, height = self.size
+        left = max(0, left)
+        right = min(width, right)
+        crc = 0
+        if right <= left:
+            return crc
+
+        if self.buffer is not None:
+            view = memoryview(self.buffer)
+            for y in rows:
+                if 0 <= y < height:
+                    start = (y * width + left) * 4
+                    crc = zlib.crc32(view[start:start + (right - left) * 4], crc)
+            return crc
+
+        for y in rows:
+            if 0 <= y < height:
+                crc = zlib.crc32(self._image.crop((left, y, right, y + 1)).tobytes(), crc)
+        return crc
+
+    def to_image(self):
+        """Get the frame as a PIL image, converting it on first use"""
+        if self._image is None:
+            self._image = Image.frombytes("RGB", self.size, bytes(self.buffer), "raw", "BGRX")
+        return self._image
+
+
+def as_frame(screenshot):
+    """Wrap a PIL image in a Frame, passing frames through unchanged"""
+    if isinstance(screenshot, Frame):
+        return screenshot
+    return Frame.from_image(screenshot)
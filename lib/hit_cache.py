@@ -0,0 +1,108 @@
+"""
+Recent button positions per monitor and resolution, kept across sessions
+"""
+import json
+import os
+from .logger import debug_log
+from .settings_handler import atomic_write
+
+# Stored next to log.txt
+HIT_CACHE_FILE = 'hit_cache.json'
+
+# Positions remembered per monitor and resolution
+MAX_HITS = 4
+
+
+def get_cache_key(monitor, screen_width, screen_height, profile=None):
+    """Key of a monitor/resolution pair (and detection profile, if not the default one) in the cache file"""
+    key = f"{monitor['name']} {screen_width}x{screen_height}"
+    return f"{key} {profile}" if profile else key
+
+
+class HitCache:
+    """
+    Where the button was found on one monitor at one resolution
+
+    Hits are (run_start, run_end) x ranges of the target color run on the
+    scan row, relative to the monitor, most recent first. detect_button
+    probes these before scanning the whole row. The file holds every
+    monitor/resolution pair; only this cache's key is rewritten on save.
+
+    Args:
+        path: Cache file path
+        key: Key from get_cache_key()
+        max_hits: Number of positions to remember
+    """
+
+    def __init__(self, path, key, max_hits=MAX_HITS):
+        self.path = path
+        self.key = key
+        self.max_hits = max(1, max_hits)
+        self.hits = []
+        self.dirty = False
+
+    @classmethod
+    def for_monitor(cls, script_dir, monitor, screen_width, screen_height, profile=None):
+        """Load the cache of a monitor/resolution pair (and profile) from script_dir"""
+        key = get_cache_key(monitor, screen_width, screen_height, profile)
+        cache = cls(os.path.join(script_dir, HIT_CACHE_FILE), key)
+        cache.load()
+        return cache
+
+    def read_file(self):
+        """Read the whole cache file, or an empty dict if it is missing or unreadable"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            debug_log("Could not read %s: %s", self.path, e)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def load(self):
+        """Load this key's hits from the cache file"""
+        hits = []
+        for entry in self.read_file().get(self.key, []):
+            try:
+                run_start, run_end = (int(value) for value in entry)
+            except (TypeError, ValueError):
+                continue
+            if 0 <= run_start <= run_end:
+                hits.append((run_start, run_end))
+        self.hits = hits[:self.max_hits]
+        self.dirty = False
+        debug_log("Hit cache %r: %s", self.key, self.hits)
+
+    def positions(self):
+        """Remembered (run_start, run_end) ranges, most recent first"""
+        return list(self.hits)
+
+    def record(self, run_start, run_end):
+        """Remember a hit, replacing older hits on the same run"""
+        hits = [(start, end) for start, end in self.hits if end < run_start or start > run_end]
+        hits.insert(0, (run_start, run_end))
+        hits = hits[:self.max_hits]
+        if hits != self.hits:
+            self.hits = hits
+            self.dirty = True
+
+    def save(self):
+        """
+        Write the hits to the cache file if they changed
+
+        Returns:
+            True if the file was written
+        """
+        if not self.dirty:
+            return False
+        data = self.read_file()
+        data[self.key] = [list(hit) for hit in self.hits]
+        try:
+            atomic_write(self.path, json.dumps(data, indent=2, sort_keys=True))
+        except OSError as e:
+            debug_log("Could not write %s: %s", self.path, e)
+            return False
+        self.dirty = False
+        return True
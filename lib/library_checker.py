@@ -1,40 +1,101 @@
 """
 Centralized library availability checking to eliminate redundant import checks
 """
+import atexit
+import importlib.util
+import os
+import sys
+import time
+
+# Set LAP_IMPORT_REPORT=1 to print how long module loading took when the app exits
+IMPORT_REPORT_ENABLED = os.environ.get('LAP_IMPORT_REPORT', '').lower() in ('1', 'true', 'yes')
+
+# Seconds spent loading each lazily imported module (filled in on first use)
+IMPORT_TIMES = {}
 
 # Library availability flags
 LIBRARIES = {
     'screeninfo': False,
     'mss': False,
+    'numpy': False,
     'windows_mouse': False
 }
 
+def has_module(module_name):
+    """Check if a module can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
 # Initialize library availability
 def check_libraries():
     """Check availability of optional libraries"""
+    start = time.perf_counter()
     
-    # Check screeninfo
-    try:
-        from screeninfo import get_monitors
-        LIBRARIES['screeninfo'] = True
-    except ImportError:
-        LIBRARIES['screeninfo'] = False
+    # Optional libraries are only located here; they are imported on first use
+    LIBRARIES['screeninfo'] = has_module('screeninfo')
+    LIBRARIES['mss'] = has_module('mss')
+    LIBRARIES['numpy'] = has_module('numpy')
     
-    # Check mss
-    try:
-        from mss import mss
-        LIBRARIES['mss'] = True
-    except ImportError:
-        LIBRARIES['mss'] = False
+    # Windows mouse control (ctypes.windll only exists on Windows)
+    LIBRARIES['windows_mouse'] = sys.platform == 'win32' and has_module('ctypes')
     
-    # Check Windows mouse control
-    try:
-        import ctypes
-        from ctypes import wintypes
-        ctypes.windll.user32  # Test access
-        LIBRARIES['windows_mouse'] = True
-    except (ImportError, AttributeError):
-        LIBRARIES['windows_mouse'] = False
+    IMPORT_TIMES['(library check)'] = time.perf_counter() - start
+
+class _TimedLoader:
+    """Loader wrapper that records how long the wrapped module took to execute"""
+    
+    def __init__(self, module_name, loader):
+        self.module_name = module_name
+        self.loader = loader
+    
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+    
+    def exec_module(self, module):
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            IMPORT_TIMES[self.module_name] = time.perf_counter() - start
+    
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+def lazy_import(module_name):
+    """
+    Import a module on first attribute access
+    
+    The module is located right away (so a missing module still raises
+    ImportError here) but only executed when something is first read from
+    it, which keeps heavy libraries out of application startup.
+    
+    Args:
+        module_name: Full module name, e.g. 'pyautogui' or 'PIL.Image'
+    
+    Returns:
+        The module object (loaded lazily)
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    
+    spec = importlib.util.find_spec(module_name)
+    if spec is None:
+        raise ImportError(f"No module named '{module_name}'", name=module_name)
+    
+    loader = importlib.util.LazyLoader(_TimedLoader(module_name, spec.loader))
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    
+    # Make the submodule reachable from its package, like a normal import does
+    parent_name, _, child_name = module_name.rpartition('.')
+    if parent_name:
+        setattr(sys.modules[parent_name], child_name, module)
+    
+    loader.exec_module(module)
+    return module
 
 def is_available(library_name):
     """Check if a library is available"""
@@ -50,6 +111,9 @@ def get_missing_libraries():
     if not LIBRARIES['mss']:
         missing.append(('mss', 'pip install mss', 'Multi-monitor screenshots may not work properly'))
     
+    if not LIBRARIES['numpy']:
+        missing.append(('numpy', 'pip install numpy', 'Detection will use the slower per-pixel scan'))
+    
     if not LIBRARIES['windows_mouse']:
         missing.append(('Windows API', 'Built into Windows', 'Multi-monitor clicking may be unreliable'))
     
@@ -60,6 +124,7 @@ def print_library_status():
     print(f"Library Status:")
     print(f"  screeninfo: {'✓' if LIBRARIES['screeninfo'] else '✗'}")
     print(f"  mss: {'✓' if LIBRARIES['mss'] else '✗'}")
+    print(f"  numpy: {'✓' if LIBRARIES['numpy'] else '✗'}")
     print(f"  Windows mouse API: {'✓' if LIBRARIES['windows_mouse'] else '✗'}")
     
     missing = get_missing_libraries()
@@ -69,5 +134,14 @@ def print_library_status():
             print(f"  {name}: {install_cmd}")
             print(f"    Impact: {impact}")
 
+def print_import_report():
+    """Print how long the library check and each lazily imported module took"""
+    print("Import times:")
+    for module_name, seconds in sorted(IMPORT_TIMES.items(), key=lambda item: -item[1]):
+        print(f"  {module_name}: {seconds * 1000:.1f} ms")
+
 # Initialize on import
-check_libraries()
\ No newline at end of file
+check_libraries()
+
+if IMPORT_REPORT_ENABLED:
+    atexit.register(print_import_report)
\ No newline at end of file
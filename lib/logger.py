@@ -1,33 +1,95 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 
 # Global logger instance
 logger = None
 
+# Cached enabled flag so hot paths can skip debug work with one global read
+_debug_enabled = False
 
-def setup_logging(debug_enabled, script_dir):
-    """Setup logging configuration based on debug settings"""
-    global logger
+# Background writer draining the log queue into the file
+_listener = None
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the writer thread"""
+    
+    def prepare(self, record):
+        # The queue stays in-process, so the record can be passed as-is and
+        # formatted (and written) by the listener instead of the calling thread
+        return record
+
+
+def shutdown_logging(keep_file_logging=False):
+    """
+    Write out any queued messages and stop the background writer
+    
+    With keep_file_logging, debug logging stays enabled and later messages
+    (from the GUI thread, between detection runs) are written to log.txt
+    directly instead of through the writer thread.
+    """
+    global _listener, _debug_enabled
+    
+    # File handlers used by the writer thread, or attached directly after an earlier run
+    file_handlers = []
+    if _listener is not None:
+        _listener.stop()
+        file_handlers.extend(_listener.handlers)
+        _listener = None
+    if logger:
+        file_handlers.extend(h for h in logger.handlers if not isinstance(h, _DeferredQueueHandler))
+        logger.handlers.clear()
+    
+    if keep_file_logging and _debug_enabled and logger:
+        for handler in file_handlers:
+            logger.addHandler(handler)
+        return
+    
+    _debug_enabled = False
+    for handler in file_handlers:
+        handler.close()
+
+
+def setup_logging(debug_enabled, script_dir, max_size_mb=5.0, backup_count=3):
+    """
+    Setup logging configuration based on debug settings
+    
+    Messages go through an in-memory queue to a background writer thread, so
+    disk stalls never add latency to the caller. log.txt is rotated once it
+    reaches max_size_mb, keeping backup_count older files (log.txt.1, ...).
+    """
+    global logger, _debug_enabled, _listener
     
     log_file = os.path.join(script_dir, 'log.txt')
     
+    # Stop the previous writer (flushes its queue) before replacing handlers
+    shutdown_logging()
+    
     # Create logger
     logger = logging.getLogger('winrate_debug')
     logger.setLevel(logging.DEBUG if debug_enabled else logging.INFO)
-    
-    # Clear existing handlers
-    logger.handlers.clear()
+    _debug_enabled = bool(debug_enabled)
     
     if debug_enabled:
-        # File handler for debug logs
-        file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+        # Rotating file handler for debug logs, only used by the writer thread
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, mode='a', encoding='utf-8',
+            maxBytes=int(max(0.1, max_size_mb) * 1024 * 1024),
+            backupCount=max(1, int(backup_count))
+        )
         file_handler.setLevel(logging.DEBUG)
         
         # Create formatter
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
         
-        logger.addHandler(file_handler)
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(_DeferredQueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
         
         # Add session separator
         logger.info("=" * 50)
@@ -37,10 +99,24 @@ def setup_logging(debug_enabled, script_dir):
     return logger
 
 
-def debug_log(message):
-    """Log debug message if debug logging is enabled"""
-    if logger:
-        logger.debug(message)
+# Make sure queued messages reach the file when the program exits
+atexit.register(shutdown_logging)
+
+
+def is_debug_enabled():
+    """Cheap check for whether debug messages will actually be written"""
+    return _debug_enabled
+
+
+def debug_log(message, *args):
+    """
+    Log debug message if debug logging is enabled
+    
+    Extra args are %-formatted into the message only when it is written, so hot
+    paths pass values instead of building f-strings that would be thrown away.
+    """
+    if _debug_enabled:
+        logger.debug(message, *args)
 
 
 def info_log(message):
@@ -1,9 +1,29 @@
-import pyautogui
-from .library_checker import is_available
+import sys
+from .library_checker import is_available, lazy_import
+
+# Heavy modules are loaded on first use
+pyautogui = lazy_import('pyautogui')
 
 # Import screeninfo if available
 if is_available('screeninfo'):
-    from screeninfo import get_monitors
+    screeninfo = lazy_import('screeninfo')
+
+def set_dpi_awareness():
+    """
+    Make the process DPI aware on Windows, as importing pyautogui does
+    
+    Must run before the Tk window is created and before monitors are listed,
+    so window scaling and monitor sizes stay the same now that pyautogui is
+    only imported on first use.
+    """
+    if sys.platform != 'win32':
+        return
+    try:
+        import ctypes
+        ctypes.windll.user32.SetProcessDPIAware()
+    except (AttributeError, OSError):
+        # Windows versions without DPI awareness support
+        pass
 
 def get_monitor_info():
     """Get information about all available monitors"""
@@ -21,7 +41,7 @@ def get_monitor_info():
         }]
     
     monitors = []
-    for i, monitor in enumerate(get_monitors()):
+    for i, monitor in enumerate(screeninfo.get_monitors()):
         monitors.append({
             'index': i,
             'name': f"Monitor {i + 1}",
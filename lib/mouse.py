@@ -1,7 +1,9 @@
 import time
-import pyautogui
 from .logger import debug_log
-from .library_checker import is_available
+from .library_checker import is_available, lazy_import
+
+# Heavy modules are loaded on first use
+pyautogui = lazy_import('pyautogui')
 
 # Get library availability
 WINDOWS_MOUSE_AVAILABLE = is_available('windows_mouse')
@@ -22,7 +24,7 @@ def get_cursor_pos():
 
 def move_cursor(x, y, verify=False):
     """Move cursor to coordinates with optional verification"""
-    debug_log(f"Moving cursor to ({x}, {y})")
+    debug_log("Moving cursor to (%s, %s)", x, y)
     
     if WINDOWS_MOUSE_AVAILABLE:
         user32.SetCursorPos(int(x), int(y))
@@ -40,7 +42,7 @@ def move_cursor(x, y, verify=False):
 
 def click_at_position(x, y):
     """Perform a click at the specified position"""
-    debug_log(f"Clicking at ({x}, {y})")
+    debug_log("Clicking at (%s, %s)", x, y)
     
     if WINDOWS_MOUSE_AVAILABLE:
         # Move and verify position
@@ -74,7 +76,7 @@ def ensure_cursor_on_monitor(monitor, x_offset=100, y_offset=100):
     target_x = max(monitor['x'], min(monitor['x'] + monitor['width'] - 1, monitor['x'] + x_offset))
     target_y = max(monitor['y'], min(monitor['y'] + monitor['height'] - 1, monitor['y'] + y_offset))
     
-    debug_log(f"Moving cursor to monitor {monitor['name']} at ({target_x}, {target_y})")
+    debug_log("Moving cursor to monitor %s at (%s, %s)", monitor['name'], target_x, target_y)
     return move_cursor(target_x, target_y, verify=True)
 
 def smart_click(x, y, target_monitor=None, force_cursor_to_monitor=False, restore_cursor=False):
@@ -101,7 +103,7 @@ def smart_click(x, y, target_monitor=None, force_cursor_to_monitor=False, restor
     
     # Restore cursor position if requested
     if restore_cursor and original_pos:
-        debug_log(f"Restoring cursor to original position: {original_pos}")
+        debug_log("Restoring cursor to original position: %s", original_pos)
         move_cursor(original_pos[0], original_pos[1])
     elif target_monitor and not restore_cursor:
         # Move to safe position on target monitor
@@ -0,0 +1,137 @@
+"""
+Headless detection runner
+
+Runs the same capture/detect/click loop as the GUI without loading Tk:
+
+    python -m lib.run [--monitor N] [--resolution WIDTHxHEIGHT] [--verbose] [--debug]
+
+Settings are read from settings.ini; the monitor and resolution default to
+the ones saved by the GUI. Stop with Ctrl+C (or SIGTERM).
+"""
+import argparse
+import signal
+import sys
+import threading
+import time
+from .settings_handler import load_settings_with_comments
+from .monitor import get_monitor_info, set_dpi_awareness
+from .run_config import RunConfig
+from .detection_loop import DetectionLoop
+
+
+def parse_resolution(text):
+    """Parse 'WIDTHxHEIGHT' (optionally followed by a label) into (width, height), or None"""
+    try:
+        res_part = str(text).split('(')[0].strip()
+        width_str, height_str = res_part.lower().split('x', 1)
+        width, height = int(width_str.strip()), int(height_str.strip())
+    except ValueError:
+        return None
+    if width <= 0 or height <= 0:
+        return None
+    return width, height
+
+
+def choose_monitor(monitors, settings, monitor_arg=None):
+    """
+    Pick the monitor to scan
+
+    Args:
+        monitors: List from get_monitor_info()
+        settings: Loaded settings (SELECTED_MONITOR saved by the GUI)
+        monitor_arg: 1-based monitor number or monitor name from the command line
+
+    Returns:
+        (monitor, saved) where saved is True if the GUI's saved monitor was used
+    """
+    if monitor_arg:
+        if monitor_arg.isdigit() and 1 <= int(monitor_arg) <= len(monitors):
+            return monitors[int(monitor_arg) - 1], False
+        for monitor in monitors:
+            if monitor['name'].lower() == monitor_arg.lower():
+                return monitor, False
+        raise ValueError(f"Unknown monitor '{monitor_arg}' (1-{len(monitors)} or a monitor name)")
+
+    for monitor in monitors:
+        if monitor['name'] == settings.get('selected_monitor'):
+            return monitor, True
+
+    return next((m for m in monitors if m.get('is_primary', False)), monitors[0]), False
+
+
+def print_status(message):
+    """Print a status message with a timestamp"""
+    print(f"[{time.strftime('%H:%M:%S')}] {message}", flush=True)
+
+
+def install_signal_handlers(stop_event):
+    """Set stop_event on Ctrl+C, SIGTERM and (on Windows) Ctrl+Break"""
+    def handle_signal(signum, frame):
+        if not stop_event.is_set():
+            print_status("Stopping...")
+        stop_event.set()
+
+    for name in ('SIGINT', 'SIGTERM', 'SIGBREAK'):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), handle_signal)
+
+
+def main(argv=None):
+    """Run detection until interrupted; returns the process exit code"""
+    parser = argparse.ArgumentParser(prog='python -m lib.run', description="Limbus Auto Player without the GUI")
+    parser.add_argument('--monitor', help="monitor number (1, 2, ...) or name; defaults to the GUI's selection")
+    parser.add_argument('--resolution', help="detection resolution as WIDTHxHEIGHT; defaults to the GUI's setting")
+    parser.add_argument('--verbose', action='store_true', help="print a line for every scan")
+    parser.add_argument('--debug', action='store_true', help="write debug logging to log.txt")
+    args = parser.parse_args(argv)
+
+    # Monitor sizes have to be read with the same DPI awareness as the GUI
+    set_dpi_awareness()
+    
+    try:
+        # Copy the shared settings so command line overrides stay local
+        settings = dict(load_settings_with_comments())
+        monitors = get_monitor_info()
+        monitor, saved_monitor = choose_monitor(monitors, settings, args.monitor)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.resolution:
+        resolution = parse_resolution(args.resolution)
+        if resolution is None:
+            print(f"Error: invalid resolution '{args.resolution}' (use WIDTHxHEIGHT)", file=sys.stderr)
+            return 1
+    else:
+        # Like the GUI, the saved resolution only applies to the saved monitor
+        resolution = parse_resolution(settings.get('resolution')) if saved_monitor else None
+        if resolution is None:
+            resolution = (monitor['width'], monitor['height'])
+    screen_width, screen_height = resolution
+
+    if args.debug:
+        settings['debug_logging'] = True
+    config = RunConfig.from_settings(settings)
+
+    stop_event = threading.Event()
+    install_signal_handlers(stop_event)
+
+    loop = DetectionLoop(
+        settings, monitor, screen_width, screen_height,
+        stop_event=stop_event, run_config=config,
+        status_callback=print_status, scan_status=args.verbose
+    )
+
+    print(f"Limbus Auto Player (headless) - {monitor['name']} at {screen_width}x{screen_height}, "
+          f"scanning every {config.check_interval}s. Press Ctrl+C to stop.", flush=True)
+
+    loop.run()
+
+    elapsed = time.perf_counter() - loop.session_start if loop.session_start else 0.0
+    print_status(f"Stopped after {loop.scan_count} scans and {loop.click_count} clicks in {elapsed:.0f}s")
+    # Scripts and schedulers can tell a failed run from one that was stopped
+    return 1 if loop.error else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Immutable snapshot of the settings the detection loop reads every scan
+"""
+from .color_matcher import get_color_matcher, build_palette
+from .config import DEFAULTS
+
+
+class RunConfig:
+    """
+    Frozen run configuration shared with the detection worker
+
+    A new RunConfig is built on the main thread whenever a setting changes and
+    swapped in with a single attribute assignment, so the worker can read the
+    current one without locks and every scan sees one consistent set of values.
+    """
+
+    __slots__ = (
+        'check_interval',
+        'tolerance',
+        'target_color',
+        'secondary_color',
+        'extra_target_colors',
+        'extra_secondary_colors',
+        'target_matcher',
+        'secondary_matcher',
+        'alt_tab_after_click',
+        'reset_cursor_position',
+        'force_cursor_to_monitor',
+        'debug_logging',
+    )
+
+    def __init__(self, check_interval, tolerance, target_color, secondary_color,
+                 alt_tab_after_click, reset_cursor_position, force_cursor_to_monitor,
+                 debug_logging, target_matcher=None, secondary_matcher=None,
+                 extra_target_colors=(), extra_secondary_colors=()):
+        target_palette = build_palette(target_color, extra_target_colors)
+        secondary_palette = build_palette(secondary_color, extra_secondary_colors)
+        values = {
+            'check_interval': float(check_interval),
+            'tolerance': int(tolerance),
+            'target_color': tuple(target_color),
+            'secondary_color': tuple(secondary_color),
+            'extra_target_colors': tuple(tuple(color) for color in extra_target_colors),
+            'extra_secondary_colors': tuple(tuple(color) for color in extra_secondary_colors),
+            'alt_tab_after_click': bool(alt_tab_after_click),
+            'reset_cursor_position': bool(reset_cursor_position),
+            'force_cursor_to_monitor': bool(force_cursor_to_monitor),
+            'debug_logging': bool(debug_logging),
+            'target_matcher': target_matcher or get_color_matcher(target_palette, int(tolerance)),
+            'secondary_matcher': secondary_matcher or get_color_matcher(secondary_palette, int(tolerance)),
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RunConfig is immutable, build a new one instead")
+
+    def __delattr__(self, name):
+        raise AttributeError("RunConfig is immutable, build a new one instead")
+
+    @classmethod
+    def from_settings(cls, settings):
+        """Build a run configuration from a loaded settings dict"""
+        def value(name):
+            return settings.get(name, DEFAULTS[name])
+
+        return cls(
+            check_interval=value('check_interval'),
+            tolerance=value('tolerance'),
+            target_color=value('target_color'),
+            secondary_color=value('secondary_color'),
+            alt_tab_after_click=value('alt_tab_after_click'),
+            reset_cursor_position=value('reset_cursor_position'),
+            force_cursor_to_monitor=value('force_cursor_to_monitor'),
+            debug_logging=value('debug_logging'),
+            extra_target_colors=value('extra_target_colors'),
+            extra_secondary_colors=value('extra_secondary_colors'),
+        )
+
+    def __repr__(self):
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"RunConfig({values})"
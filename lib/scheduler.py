@@ -0,0 +1,69 @@
+"""
+Deadline-based scheduling for the detection scan loop
+"""
+import time
+from .logger import debug_log
+
+SCHEDULE_MODES = ('fixed_rate', 'fixed_delay')
+
+
+class ScanScheduler:
+    """
+    Waits between scans against absolute deadlines
+
+    fixed_rate: scans start every interval seconds no matter how long each
+                scan took; a scan that overruns its slot counts as a missed
+                deadline and the schedule restarts from now instead of
+                bursting to catch up.
+    fixed_delay: the wait is interval seconds from the end of each scan.
+
+    Waiting is done on stop_event, so a stop request ends the wait at once.
+    """
+
+    def __init__(self, interval, stop_event, mode='fixed_rate'):
+        if mode not in SCHEDULE_MODES:
+            debug_log("Unknown schedule mode '%s', using fixed_rate", mode)
+            mode = 'fixed_rate'
+        self.interval = interval
+        self.stop_event = stop_event
+        self.mode = mode
+        self.next_deadline = None
+        self.missed_deadlines = 0
+        self.last_lateness = 0.0
+
+    def start(self):
+        """Mark the start of the first scan"""
+        self.next_deadline = time.perf_counter()
+        self.missed_deadlines = 0
+        self.last_lateness = 0.0
+
+    def wait(self, interval=None):
+        """
+        Wait until the next scan is due
+
+        Args:
+            interval: New interval in seconds, if it changed since the last scan
+
+        Returns:
+            True if stop_event was set while waiting
+        """
+        if interval is not None:
+            self.interval = interval
+
+        now = time.perf_counter()
+        if self.next_deadline is None:
+            self.next_deadline = now
+
+        if self.mode == 'fixed_delay':
+            self.next_deadline = now + self.interval
+        else:
+            self.next_deadline += self.interval
+            if self.next_deadline < now:
+                # The scan ran past the start of the next slot
+                self.last_lateness = now - self.next_deadline
+                self.missed_deadlines += 1
+                debug_log("Missed scan deadline by %.1f ms (%d missed so far)",
+                          self.last_lateness * 1000, self.missed_deadlines)
+                self.next_deadline = now
+
+        return self.stop_event.wait(max(0.0, self.next_deadline - now))
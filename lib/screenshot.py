@@ -1,18 +1,137 @@
-import pyautogui
-from PIL import Image
 from .logger import debug_log
-from .library_checker import is_available
+from .library_checker import is_available, lazy_import
+from .frame import Frame
+
+# Heavy modules are loaded on first use
+pyautogui = lazy_import('pyautogui')
 
 # Import mss if available
 if is_available('mss'):
-    from mss import mss
+    mss = lazy_import('mss')
+
+def get_scan_strip_region(detection_settings, screen_width, screen_height):
+    """
+    Get the part of the monitor that detection actually reads
+    
+    This is the scan row plus half the search area above and below it, across
+    the scan range plus half the search area on each side.
+    
+    Returns:
+        Region dict with left, top, width and height relative to the monitor
+    """
+    half_size = detection_settings['search_area_size'] // 2
+    check_row = detection_settings['check_row_relative']
+    
+    left = max(0, detection_settings['x_start_relative'] - half_size)
+    right = min(screen_width, detection_settings['x_end_relative'] + half_size)
+    top = max(0, check_row - half_size)
+    bottom = min(screen_height, check_row + half_size + 1)
+    
+    return {
+        "left": left,
+        "top": top,
+        "width": max(1, right - left),
+        "height": max(1, bottom - top),
+    }
+
+def merge_regions(regions):
+    """
+    Get the smallest region containing all of the given regions
+    
+    Used to capture the strips of several detection profiles in one screenshot.
+    """
+    left = min(region['left'] for region in regions)
+    top = min(region['top'] for region in regions)
+    right = max(region['left'] + region['width'] for region in regions)
+    bottom = max(region['top'] + region['height'] for region in regions)
+    return {
+        "left": left,
+        "top": top,
+        "width": right - left,
+        "height": bottom - top,
+    }
+
+class CaptureSession:
+    """
+    Long-lived mss capture context reused for every screenshot
+    
+    Opening mss creates the platform capture resources (device contexts, X
+    connection), so the detection worker keeps one session open for the whole
+    run instead of paying that cost on every scan. The session must be used and
+    closed from the thread that opened it.
+    """
+    
+    def __init__(self):
+        self.sct = None
+    
+    def open(self):
+        """Open the capture context if needed, returns True if it is usable"""
+        if self.sct is None and is_available('mss'):
+            try:
+                self.sct = mss.mss()
+                debug_log("Capture session opened")
+            except Exception as e:
+                debug_log("Could not open capture session: %s", e)
+        return self.sct is not None
+    
+    def close(self):
+        """Release the capture context"""
+        if self.sct is not None:
+            try:
+                self.sct.close()
+            except Exception as e:
+                debug_log("Error closing capture session: %s", e)
+            self.sct = None
+            debug_log("Capture session closed")
+    
+    def grab(self, monitor_region):
+        """Grab a region, reopening the session once if the grab fails"""
+        if not self.open():
+            raise RuntimeError("capture session could not be opened")
+        
+        try:
+            return self.sct.grab(monitor_region)
+        except Exception as e:
+            debug_log("Capture session grab failed, reopening: %s", e)
+            self.close()
+            self.open()
+            return self.sct.grab(monitor_region)
+    
+    def __enter__(self):
+        self.open()
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
 
-def take_monitor_screenshot(monitor, screen_width, screen_height):
-    """Take a screenshot of a specific monitor using best available method"""
+def take_monitor_screenshot(monitor, screen_width, screen_height, region=None, session=None):
+    """
+    Take a screenshot of a specific monitor using best available method
+    
+    Returns:
+        (Frame, used_mss) tuple
+    
+    Args:
+        monitor: Monitor dict
+        screen_width, screen_height: Resolution to capture
+        region: Optional region dict (left, top, width, height) relative to the
+                monitor. Only honored by mss; the pyautogui fallback always
+                returns the full desktop.
+        session: Optional open CaptureSession to grab with. Without one a
+                 temporary mss context is created for this screenshot.
+    """
     if is_available('mss'):
         # Use mss for better multi-monitor support
-        with mss() as sct:
-            try:
+        try:
+            if region:
+                # Capture only the requested part of the monitor
+                monitor_region = {
+                    "top": monitor['y'] + region['top'],
+                    "left": monitor['x'] + region['left'],
+                    "width": region['width'],
+                    "height": region['height'],
+                }
+            else:
                 # Create monitor region with corrected dimensions
                 monitor_region = {
                     "top": monitor['y'],
@@ -20,19 +139,23 @@ def take_monitor_screenshot(monitor, screen_width, screen_height):
                     "width": screen_width,
                     "height": screen_height,
                 }
-                
-                debug_log(f"MSS capturing region: {monitor_region}")
-                
-                # Take screenshot of specific region
-                screenshot_data = sct.grab(monitor_region)
-                # Convert to PIL Image
-                screenshot = Image.frombytes("RGB", screenshot_data.size, screenshot_data.bgra, "raw", "BGRX")
-                debug_log(f"Screenshot taken using mss: {screenshot.size[0]}x{screenshot.size[1]}")
-                return screenshot, True  # True indicates we used mss
-            except Exception as e:
-                debug_log(f"mss failed, falling back to pyautogui: {e}")
+            
+            debug_log("MSS capturing region: %s", monitor_region)
+            
+            # Take screenshot of specific region
+            if session is not None:
+                screenshot_data = session.grab(monitor_region)
+            else:
+                with mss.mss() as sct:
+                    screenshot_data = sct.grab(monitor_region)
+            # Wrap the raw BGRA buffer; a PIL image is only built if something asks for one
+            screenshot = Frame.from_mss(screenshot_data)
+            debug_log("Screenshot taken using mss: %dx%d", screenshot.size[0], screenshot.size[1])
+            return screenshot, True  # True indicates we used mss
+        except Exception as e:
+            debug_log("mss failed, falling back to pyautogui: %s", e)
     
     # Fallback to pyautogui (works for primary monitor, limited for secondary)
-    screenshot = pyautogui.screenshot()
-    debug_log(f"Screenshot taken using pyautogui: {screenshot.size[0]}x{screenshot.size[1]}")
-    return screenshot, False  # False indicates we used pyautogui
\ No newline at end of file
+    screenshot = Frame.from_image(pyautogui.screenshot())
+    debug_log("Screenshot taken using pyautogui: %dx%d", screenshot.size[0], screenshot.size[1])
+    return screenshot, False  # False indicates we used pyautogui
@@ -6,21 +6,72 @@ This module should be saved as 'settings_handler.py' in the same directory as LA
 """
 
 import os
+import tempfile
+import threading
 from typing import Any
+from .config import build_settings, build_profile_settings, get_settings_file
+
+# Saves requested with save_later() within this many seconds are written once
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+
+def atomic_write(file_path: str, content: str):
+    """
+    Write a text file by writing a temporary file next to it and renaming it
+    
+    The rename replaces the old file in one step, so a crash or power loss
+    mid-write leaves either the old or the new file, never a truncated one.
+    The temporary file is named after the target (.settings.ini-XXXX.tmp).
+    """
+    directory, file_name = os.path.split(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(prefix=f'.{file_name}-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def format_value(value: Any) -> str:
+    """Format a value the way it is written to settings.ini"""
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
 
 class CommentPreservingSettings:
-    """Settings handler that preserves comments and formatting"""
+    """
+    Settings handler that preserves comments and formatting
+    
+    The line of every key is indexed by (section, key), so set() rewrites a
+    single line, and only keys whose line actually changed mark the file as
+    dirty. save() writes nothing when nothing is dirty, and save_later()
+    coalesces bursts of saves into one write.
+    """
     
     def __init__(self, file_path: str):
         self.file_path = file_path
         self.lines = []
         self.settings = {}
+        self.line_index = {}
+        self.dirty = set()
+        self.lock = threading.RLock()
+        self.save_timer = None
         self.load()
     
     def load(self):
         """Load settings while preserving all formatting and comments"""
         self.lines = []
         self.settings = {}
+        self.line_index = {}
+        self.dirty = set()
         
         if not os.path.exists(self.file_path):
             # Create default settings file if it doesn't exist
@@ -32,7 +83,7 @@ class CommentPreservingSettings:
                 self.lines = f.readlines()
             
             current_section = None
-            for line in self.lines:
+            for line_number, line in enumerate(self.lines):
                 stripped = line.strip()
                 
                 # Skip empty lines and comments
@@ -49,6 +100,7 @@ class CommentPreservingSettings:
                     key, value = stripped.split('=', 1)
                     key = key.strip().upper()
                     value = value.strip()
+                    self.line_index[(current_section, key)] = line_number
                     
                     # Convert value to appropriate type
                     if current_section not in self.settings:
@@ -94,16 +146,61 @@ SECONDARY_COLOR_R = 246
 SECONDARY_COLOR_G = 175
 SECONDARY_COLOR_B = 100
 
+# More acceptable colors for the target and secondary color, for lighting,
+# theme or HDR variations, written as R,G,B separated by ';'
+# (e.g. 64,4,0; 52,0,0). They are matched in a single lookup, so extra colors
+# do not slow down scanning.
+EXTRA_TARGET_COLORS =
+EXTRA_SECONDARY_COLORS =
+
 # Color matching tolerance (higher = more lenient matching)
 TOLERANCE = 10
 
 # Size of the search area around the found target color in pixels
 SEARCH_AREA_SIZE = 50
 
+# Minimum fraction (0.0-1.0) of pixels in the search area that must match the
+# secondary color (0 = a single matching pixel is enough)
+SECONDARY_MIN_MATCH_FRACTION = 0.0
+
+# Minimum width in pixels of a run of target color on the scan row for it to be
+# considered a button (shorter runs, e.g. stray pixels, are ignored)
+MIN_BUTTON_WIDTH = 10
+# Pixel step of the first pass over the scan row; only the pixels between and
+# around matches are checked one by one. 0 = use MIN_BUTTON_WIDTH (the largest
+# step that cannot miss a run that wide, larger values are capped to it)
+SCAN_STRIDE = 0
+
+# Set to true to skip detection when the scanned part of the screen has not
+# changed since the last scan (the previous "not found" result is reused)
+SKIP_UNCHANGED_FRAMES = true
+# Set to true to check where the button was found before (saved per monitor and
+# resolution in lib/hit_cache.json) before scanning the whole row
+USE_HIT_CACHE = true
+
 [TIMING]
 # Seconds to wait between each scan
 CHECK_INTERVAL = 1.0
 
+# How scans are spaced: "fixed_rate" starts a scan every CHECK_INTERVAL seconds,
+# "fixed_delay" waits CHECK_INTERVAL seconds after each scan finishes
+SCHEDULE_MODE = fixed_rate
+
+[CAPTURE]
+# What to capture each scan: "strip" grabs only the scan row and the search
+# area around it, "full" grabs the whole monitor
+CAPTURE_MODE = strip
+
+# Set to true to capture continuously in a background thread and run detection
+# on the newest frame (hides capture latency)
+BACKGROUND_CAPTURE = false
+
+# Frames per second captured by the background thread
+CAPTURE_RATE = 10.0
+
+# Number of recent frames kept by the background thread
+CAPTURE_BUFFER_SIZE = 3
+
 [BEHAVIOR]
 # Set to true to Alt+Tab after clicking (switch away from game)
 ALT_TAB_AFTER_CLICK = false
@@ -118,6 +215,12 @@ FORCE_CURSOR_TO_MONITOR = false
 # Set to true to enable debug logging to log.txt file
 DEBUG_LOGGING = false
 
+# log.txt is rotated when it reaches this size in megabytes
+LOG_MAX_SIZE_MB = 5
+
+# Number of rotated log files to keep (log.txt.1, log.txt.2, ...)
+LOG_BACKUP_COUNT = 3
+
 [GUI]
 # Selected monitor name for GUI
 SELECTED_MONITOR = Monitor 1
@@ -127,10 +230,22 @@ RESOLUTION = 1920x1080
 
 # Set to true to enable dark mode (default is false for light mode)
 DARK_MODE = false
+
+# Extra buttons to look for, one [PROFILE <name>] section each. Every profile
+# is checked on the same screenshot; keys left out use the [DETECTION] value.
+# ACTION: click_enter = click, then press Enter; click = click only;
+# enter = press Enter only. Set ENABLED = false to turn a profile off.
+# A profile that sets its own target or secondary color does not inherit the
+# EXTRA_TARGET_COLORS / EXTRA_SECONDARY_COLORS of [DETECTION] for that color.
+# [PROFILE confirm]
+# CHECK_ROW_PERCENTAGE = 62.5
+# TARGET_COLOR_R = 120
+# TARGET_COLOR_G = 20
+# TARGET_COLOR_B = 10
+# ACTION = click
 """
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                f.write(default_content)
+            atomic_write(self.file_path, default_content)
             self.load()  # Reload after creating
         except Exception as e:
             print(f"Error creating default settings file: {e}")
@@ -146,43 +261,57 @@ DARK_MODE = false
         section = section.upper()
         key = key.upper()
         
-        # Ensure section exists in settings dict
-        if section not in self.settings:
-            self.settings[section] = {}
+        with self.lock:
+            # Ensure section exists in settings dict
+            if section not in self.settings:
+                self.settings[section] = {}
+            
+            self.settings[section][key] = value
+            
+            # Update the lines array
+            if self._update_line_value(section, key, value):
+                self.dirty.add((section, key))
+    
+    def _update_line_value(self, section: str, key: str, value: Any) -> bool:
+        """
+        Update a specific line in the lines array
+        
+        Returns:
+            True if the file content changed
+        """
+        line_number = self.line_index.get((section, key))
         
-        self.settings[section][key] = value
+        if line_number is None:
+            # The key isn't in the file yet, so add it to the section
+            self._add_key_to_section(section, key, value)
+            return True
         
-        # Update the lines array
-        self._update_line_value(section, key, value)
+        line = self.lines[line_number]
+        indent = len(line) - len(line.lstrip())
+        new_line = ' ' * indent + f"{key} = {format_value(value)}\n"
+        if new_line == line:
+            return False
+        
+        self.lines[line_number] = new_line
+        return True
     
-    def _update_line_value(self, section: str, key: str, value: Any):
-        """Update a specific line in the lines array"""
+    def _rebuild_index(self):
+        """Rebuild the (section, key) -> line index after lines were inserted"""
+        self.line_index = {}
         current_section = None
         
-        for i, line in enumerate(self.lines):
+        for line_number, line in enumerate(self.lines):
             stripped = line.strip()
             
-            # Track current section
+            if not stripped or stripped.startswith('#'):
+                continue
+            
             if stripped.startswith('[') and stripped.endswith(']'):
                 current_section = stripped[1:-1].upper()
                 continue
             
-            # Look for the key in the current section
-            if current_section == section and '=' in stripped:
-                line_key = stripped.split('=')[0].strip().upper()
-                if line_key == key:
-                    # Update this line with the new value
-                    indent = len(line) - len(line.lstrip())
-                    if isinstance(value, bool):
-                        str_value = str(value).lower()
-                    else:
-                        str_value = str(value)
-                    
-                    self.lines[i] = ' ' * indent + f"{key} = {str_value}\n"
-                    return
-        
-        # If we get here, the key wasn't found, so add it to the section
-        self._add_key_to_section(section, key, value)
+            if '=' in stripped and current_section:
+                self.line_index[(current_section, stripped.split('=', 1)[0].strip().upper())] = line_number
     
     def _add_key_to_section(self, section: str, key: str, value: Any):
         """Add a new key to an existing section"""
@@ -212,80 +341,106 @@ DARK_MODE = false
             self.lines.append(f"\n[{section}]\n")
             insert_index = len(self.lines)
         
-        # Add the new key-value pair
-        if isinstance(value, bool):
-            str_value = str(value).lower()
-        else:
-            str_value = str(value)
-        
         # Add appropriate comment for dark mode
         if key == 'DARK_MODE':
             comment_line = "# Set to true to enable dark mode (default is false for light mode)\n"
             self.lines.insert(insert_index, comment_line)
             insert_index += 1
         
-        self.lines.insert(insert_index, f"{key} = {str_value}\n")
+        # Add the new key-value pair
+        self.lines.insert(insert_index, f"{key} = {format_value(value)}\n")
+        
+        # Lines after the insert moved down; new keys are rare, so just reindex
+        self._rebuild_index()
     
-    def save(self):
-        """Save the settings file while preserving comments and formatting"""
+    def save(self) -> bool:
+        """
+        Save the settings file while preserving comments and formatting
+        
+        Returns:
+            True if the file was written, False if nothing had changed
+        """
+        with self.lock:
+            self._cancel_pending_save()
+            
+            if not self.dirty and os.path.exists(self.file_path):
+                return False
+            
+            try:
+                atomic_write(self.file_path, ''.join(self.lines))
+            except Exception as e:
+                print(f"Error saving settings: {e}")
+                raise
+            
+            self.dirty.clear()
+            return True
+    
+    def save_later(self, delay: float = SAVE_DEBOUNCE_SECONDS):
+        """Save after delay seconds, restarting the wait if called again before then"""
+        with self.lock:
+            self._cancel_pending_save()
+            self.save_timer = threading.Timer(delay, self._save_pending)
+            self.save_timer.daemon = True
+            self.save_timer.start()
+    
+    def flush(self):
+        """Write a save requested with save_later() right away"""
+        with self.lock:
+            if self.save_timer is not None:
+                self.save()
+    
+    def _cancel_pending_save(self):
+        if self.save_timer is not None:
+            self.save_timer.cancel()
+            self.save_timer = None
+    
+    def _save_pending(self):
+        """Timer callback for save_later()"""
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                f.writelines(self.lines)
-        except Exception as e:
-            print(f"Error saving settings: {e}")
-            raise
+            self.save()
+        except Exception:
+            pass  # Already reported by save()
+
 
+# Settings shared by everything that loads them in this process
+_settings_cache = None
 
 # Modified functions for the main GUI code
-def load_settings_with_comments():
-    """Load settings using the comment-preserving handler"""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    # Get the parent directory
-    parent_dir = os.path.dirname(script_dir)
-    settings_file = os.path.join(parent_dir, 'settings.ini')
+def load_settings_with_comments(reload=False):
+    """
+    Load settings using the comment-preserving handler
     
-    # Create the comment-preserving settings handler
-    settings_handler = CommentPreservingSettings(settings_file)
+    settings.ini is parsed once per process; later calls return the same
+    settings dict (typed values with the defaults from config.SETTINGS_SCHEMA)
+    unless reload is True.
+    """
+    global _settings_cache
     
-    # Convert to the format expected by the existing code
-    settings = {
-        'script_dir': script_dir,
-        'check_row_percentage': settings_handler.get('DETECTION', 'CHECK_ROW_PERCENTAGE', 74.17),
-        'x_start_from_center': settings_handler.get('DETECTION', 'X_START_FROM_CENTER', -1),
-        'x_end_at_edge': settings_handler.get('DETECTION', 'X_END_AT_EDGE', -1),
-        'target_color': (
-            settings_handler.get('DETECTION', 'TARGET_COLOR_R', 59),
-            settings_handler.get('DETECTION', 'TARGET_COLOR_G', 1),
-            settings_handler.get('DETECTION', 'TARGET_COLOR_B', 0)
-        ),
-        'secondary_color': (
-            settings_handler.get('DETECTION', 'SECONDARY_COLOR_R', 246),
-            settings_handler.get('DETECTION', 'SECONDARY_COLOR_G', 175),
-            settings_handler.get('DETECTION', 'SECONDARY_COLOR_B', 100)
-        ),
-        'tolerance': settings_handler.get('DETECTION', 'TOLERANCE', 10),
-        'search_area_size': settings_handler.get('DETECTION', 'SEARCH_AREA_SIZE', 50),
-        'check_interval': settings_handler.get('TIMING', 'CHECK_INTERVAL', 1.0),
-        'alt_tab_after_click': settings_handler.get('BEHAVIOR', 'ALT_TAB_AFTER_CLICK', False),
-        'reset_cursor_position': settings_handler.get('BEHAVIOR', 'RESET_CURSOR_POSITION', True),
-        'force_cursor_to_monitor': settings_handler.get('BEHAVIOR', 'FORCE_CURSOR_TO_MONITOR', False),
-        'debug_logging': settings_handler.get('DEBUG', 'DEBUG_LOGGING', False),
-        'selected_monitor': settings_handler.get('GUI', 'SELECTED_MONITOR', 'Monitor 1'),
-        'resolution': settings_handler.get('GUI', 'RESOLUTION', '1920x1080'),
-        'dark_mode': settings_handler.get('GUI', 'DARK_MODE', False),  # Default to light mode
-        '_handler': settings_handler  # Keep reference to the handler
-    }
+    if _settings_cache is None or reload:
+        # Create the comment-preserving settings handler
+        settings_handler = CommentPreservingSettings(get_settings_file())
+        
+        # Convert to the format expected by the existing code
+        settings = build_settings(settings_handler.get)
+        settings['profiles'] = build_profile_settings(settings, list(settings_handler.settings), settings_handler.get)
+        settings['_handler'] = settings_handler  # Keep reference to the handler
+        _settings_cache = settings
     
-    return settings
+    return _settings_cache
 
 
-def save_all_settings_with_comments(gui_instance, show_message=True):
-    """Save all settings while preserving comments"""
+def save_all_settings_with_comments(gui_instance, show_message=True, debounce=False):
+    """
+    Save all settings while preserving comments
+    
+    Only keys whose value changed are rewritten. With debounce the write is
+    deferred by SAVE_DEBOUNCE_SECONDS so rapid changes are saved once.
+    """
     try:
         # Get the settings handler from the loaded settings
         if '_handler' not in gui_instance.settings:
             # Fallback to old method if handler not available
-            return gui_instance.save_all_settings(show_message)
+            return gui_instance.save_all_settings(show_message, debounce)
         
         handler = gui_instance.settings['_handler']
         
@@ -319,6 +474,10 @@ def save_all_settings_with_comments(gui_instance, show_message=True):
         handler.set('GUI', 'DARK_MODE', gui_instance.dark_mode_var.get())
         
         # Save to file
+        if debounce:
+            handler.save_later()
+            return
+        
         handler.save()
         
         print("All settings saved successfully with comments preserved!")
@@ -0,0 +1,111 @@
+"""
+Per-stage timing of the detection loop with rolling percentiles
+"""
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Stages timed on every scan, in loop order
+STAGES = ('capture', 'detect', 'click', 'keys', 'scan')
+
+# Samples kept per stage for the rolling percentiles
+DEFAULT_WINDOW = 1000
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted, non-empty list"""
+    index = min(len(sorted_values), max(1, math.ceil(fraction * len(sorted_values)))) - 1
+    return sorted_values[index]
+
+
+class StageTimings:
+    """
+    Rolling timings for each stage of a scan
+
+    Durations are taken with time.perf_counter() and kept in a fixed-size
+    window per stage, so percentiles follow the recent behaviour of the
+    session while memory stays bounded. Counts and totals cover the whole
+    session. Recording happens in the worker thread; summaries can be read
+    from any thread.
+    """
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.window = max(1, window)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop all recorded timings"""
+        with self.lock:
+            self.samples = {stage: deque(maxlen=self.window) for stage in STAGES}
+            self.counts = dict.fromkeys(STAGES, 0)
+            self.totals = dict.fromkeys(STAGES, 0.0)
+
+    def record(self, stage, seconds):
+        """Record one duration in seconds for a stage"""
+        with self.lock:
+            if stage not in self.samples:
+                self.samples[stage] = deque(maxlen=self.window)
+                self.counts[stage] = 0
+                self.totals[stage] = 0.0
+            self.samples[stage].append(seconds)
+            self.counts[stage] += 1
+            self.totals[stage] += seconds
+
+    @contextmanager
+    def measure(self, stage):
+        """Time the body of a with block as one sample of stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def stats(self, stage):
+        """
+        Get rolling statistics for one stage
+
+        Returns:
+            Dict with count, mean_ms, last_ms, p50_ms, p95_ms, p99_ms and max_ms
+            (times are None until the stage has been recorded)
+        """
+        with self.lock:
+            values = list(self.samples.get(stage, ()))
+            count = self.counts.get(stage, 0)
+            total = self.totals.get(stage, 0.0)
+
+        if not values:
+            return {'count': count, 'mean_ms': None, 'last_ms': None,
+                    'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'max_ms': None}
+
+        last = values[-1]
+        values.sort()
+        return {
+            'count': count,
+            'mean_ms': total / count * 1000,
+            'last_ms': last * 1000,
+            'p50_ms': percentile(values, 0.50) * 1000,
+            'p95_ms': percentile(values, 0.95) * 1000,
+            'p99_ms': percentile(values, 0.99) * 1000,
+            'max_ms': values[-1] * 1000,
+        }
+
+    def summary(self):
+        """Get stats() for every stage, keyed by stage name"""
+        with self.lock:
+            stages = list(self.samples)
+        return {stage: self.stats(stage) for stage in stages}
+
+    def format_summary(self):
+        """One line per recorded stage, for logging"""
+        lines = []
+        for stage, stats in self.summary().items():
+            if stats['count']:
+                lines.append(
+                    f"{stage:<8} n={stats['count']:<6} p50={stats['p50_ms']:.2f} ms "
+                    f"p95={stats['p95_ms']:.2f} ms p99={stats['p99_ms']:.2f} ms "
+                    f"max={stats['max_ms']:.2f} ms"
+                )
+        return "\n".join(lines)
@@ -64,13 +64,13 @@ def display_configuration(settings, selected_monitor, screen_width, screen_heigh
     
     if to_log and settings['debug_logging']:
         debug_log("=== CONFIGURATION ===")
-        debug_log(f"Selected monitor: {selected_monitor}")
-        debug_log(f"Screen resolution: {screen_width}x{screen_height}")
-        debug_log(f"Monitor offset: {monitor_offset_x}, {monitor_offset_y}")
-        debug_log(f"Detection row: {settings['check_row_relative']} ({settings['check_row_percentage']:.2f}%)")
-        debug_log(f"Detection range: X{settings['x_start_relative']}-{settings['x_end_relative']}")
-        debug_log(f"Target color: {settings['target_color']}")
-        debug_log(f"Secondary color: {settings['secondary_color']}")
-        debug_log(f"Tolerance: {settings['tolerance']}")
-        debug_log(f"Search area size: {settings['search_area_size']}")
+        debug_log("Selected monitor: %s", selected_monitor)
+        debug_log("Screen resolution: %sx%s", screen_width, screen_height)
+        debug_log("Monitor offset: %s, %s", monitor_offset_x, monitor_offset_y)
+        debug_log("Detection row: %s (%.2f%%)", settings['check_row_relative'], settings['check_row_percentage'])
+        debug_log("Detection range: X%s-%s", settings['x_start_relative'], settings['x_end_relative'])
+        debug_log("Target color: %s", settings['target_color'])
+        debug_log("Secondary color: %s", settings['secondary_color'])
+        debug_log("Tolerance: %s", settings['tolerance'])
+        debug_log("Search area size: %s", settings['search_area_size'])
         debug_log("=== STARTING DETECTION LOOP ===")
\ No newline at end of file